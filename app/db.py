@@ -1,44 +1,199 @@
 import os
 import logging
-from typing import Optional, List
+import threading
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from pathlib import Path
 
-import pymysql
+# pymysql is imported on first DB use so workers that never touch the DB
+# don't pay the import at startup
+pymysql = None
+
+
+def _load_pymysql():
+    global pymysql
+    if pymysql is None:
+        import pymysql as _mod
+        pymysql = _mod
+    return pymysql
 
 
 logger = logging.getLogger("db")
 
 
-def get_mysql_connection() -> Optional[pymysql.connections.Connection]:
-    """Create a MySQL connection from environment variables."""
-    host = os.environ.get("DB_HOST")
-    port = int(os.environ.get("DB_PORT", "3306"))
-    user = os.environ.get("DB_USER")
-    password = os.environ.get("DB_PASSWORD")
-    database = os.environ.get("DB_NAME")
+class _PooledConnection:
+    """Thin wrapper so close() returns the connection to the pool instead of dropping it."""
+
+    def __init__(self, conn, pool):
+        self._conn = conn
+        self._pool = pool
+
+    def close(self):
+        self._pool.release(self._conn)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class _ConnectionPool:
+    """Small thread-safe pool of PyMySQL connections.
+
+    Opening a MySQL connection pays a TCP + auth handshake every time; the pool
+    keeps idle connections alive so repeated migration/insert runs reuse them.
+    """
+
+    def __init__(self, min_idle: int = 2, max_idle: int = 10, **connect_kwargs):
+        self._connect_kwargs = connect_kwargs
+        self._max_idle = max_idle
+        self._idle = []
+        self._lock = threading.Lock()
+        for _ in range(min_idle):
+            try:
+                self._idle.append(pymysql.connect(**connect_kwargs))
+            except Exception as e:
+                logger.error(f"DB: Failed to pre-open pooled connection: {e}")
+                break
+
+    def get_connection(self) -> _PooledConnection:
+        """Lease a connection, reviving or discarding stale idle ones."""
+        while True:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                conn = pymysql.connect(**self._connect_kwargs)
+            try:
+                conn.ping(reconnect=True)
+            except Exception:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+                continue
+            return _PooledConnection(conn, self)
+
+    def release(self, conn) -> None:
+        """Return a connection to the idle list, or close it if the pool is full."""
+        with self._lock:
+            if len(self._idle) < self._max_idle:
+                self._idle.append(conn)
+                return
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+_POOL: Optional[_ConnectionPool] = None
+_POOL_LOCK = threading.Lock()
+
+# DB settings don't change while the process runs; capture them once at import
+# so the pool-acquire path skips repeated os.environ lookups
+_DB_CFG = {
+    "host": os.environ.get("DB_HOST"),
+    "port": int(os.environ.get("DB_PORT", "3306")),
+    "user": os.environ.get("DB_USER"),
+    "password": os.environ.get("DB_PASSWORD"),
+    "database": os.environ.get("DB_NAME"),
+}
+_DB_POOL_MIN = int(os.environ.get("DB_POOL_MIN", "2"))
+_DB_POOL_MAX = int(os.environ.get("DB_POOL_MAX", "10"))
+
+
+def get_mysql_connection() -> Optional[_PooledConnection]:
+    """Lease a MySQL connection from a lazily-created pool (configured via env vars)."""
+    global _POOL
 
-    if not all([host, user, password, database]):
+    if not all([_DB_CFG["host"], _DB_CFG["user"], _DB_CFG["password"], _DB_CFG["database"]]):
         logger.warning("MySQL env vars not fully set; skipping DB connection")
         return None
 
     try:
-        conn = pymysql.connect(
-            host=host,
-            port=port,
-            user=user,
-            password=password,
-            database=database,
-            charset="utf8mb4",
-            autocommit=True,
-        )
-        return conn
+        _load_pymysql()
+        if _POOL is None:
+            with _POOL_LOCK:
+                if _POOL is None:
+                    _POOL = _ConnectionPool(
+                        min_idle=_DB_POOL_MIN,
+                        max_idle=_DB_POOL_MAX,
+                        charset="utf8mb4",
+                        autocommit=True,
+                        **_DB_CFG,
+                    )
+        return _POOL.get_connection()
     except Exception as e:
         logger.error(f"Failed to connect to MySQL: {e}")
         return None
 
 
+def _split_sql_statements(sql: str) -> List[str]:
+    """Split a .sql file into individual statements.
+
+    PyMySQL executes a single statement per cur.execute() call, so files that
+    contain several statements must be split on ';' — but only outside string
+    literals, backtick identifiers and comments.
+    """
+    statements: List[str] = []
+    buf: List[str] = []
+    i, n = 0, len(sql)
+    in_quote = None
+    while i < n:
+        ch = sql[i]
+        if in_quote:
+            buf.append(ch)
+            if ch == "\\" and in_quote in ("'", '"') and i + 1 < n:
+                buf.append(sql[i + 1])
+                i += 2
+                continue
+            if ch == in_quote:
+                in_quote = None
+            i += 1
+            continue
+        if ch in ("'", '"', "`"):
+            in_quote = ch
+            buf.append(ch)
+            i += 1
+            continue
+        if sql.startswith("--", i) or ch == "#":
+            j = sql.find("\n", i)
+            i = n if j == -1 else j + 1
+            continue
+        if sql.startswith("/*", i):
+            j = sql.find("*/", i + 2)
+            i = n if j == -1 else j + 2
+            continue
+        if ch == ";":
+            stmt = "".join(buf).strip()
+            if stmt:
+                statements.append(stmt)
+            buf = []
+            i += 1
+            continue
+        buf.append(ch)
+        i += 1
+    stmt = "".join(buf).strip()
+    if stmt:
+        statements.append(stmt)
+    return statements
+
+
+@lru_cache(maxsize=1)
+def _parse_migration_files(paths: Tuple[str, ...], mtime_key: float) -> Tuple[str, ...]:
+    """Read and split migration files; cached on paths + mtimes so unchanged files aren't re-parsed."""
+    statements: List[str] = []
+    for path_str in paths:
+        path = Path(path_str)
+        try:
+            sql = path.read_text(encoding="utf-8")
+            stmts = _split_sql_statements(sql)
+            statements.extend(stmts)
+            logger.info(f"DB: Loaded migration file {path.name} ({len(stmts)} statements)")
+        except Exception as e:
+            logger.error(f"DB: Failed to read migration file {path}: {e}")
+    return tuple(statements)
+
+
 def _load_sql_files() -> List[str]:
-    """Load .sql files from migrations directory in lexical order."""
+    """Load individual SQL statements from migrations directory in lexical order."""
     try:
         base_dir = Path(__file__).resolve().parent.parent  # project root
         mig_dir = base_dir / "migrations"
@@ -49,15 +204,8 @@ def _load_sql_files() -> List[str]:
         if not sql_files:
             logger.info("DB: No .sql files found in migrations directory; nothing to run")
             return []
-        statements: List[str] = []
-        for path in sql_files:
-            try:
-                sql = path.read_text(encoding="utf-8")
-                statements.append(sql)
-                logger.info(f"DB: Loaded migration file {path.name}")
-            except Exception as e:
-                logger.error(f"DB: Failed to read migration file {path}: {e}")
-        return statements
+        mtime_key = sum(p.stat().st_mtime for p in sql_files)
+        return list(_parse_migration_files(tuple(str(p) for p in sql_files), mtime_key))
     except Exception as e:
         logger.error(f"DB: Failed to load SQL migrations: {e}")
         return []
@@ -75,13 +223,15 @@ def run_migrations() -> None:
 
     try:
         with conn.cursor() as cur:
+            conn.begin()
             for idx, stmt in enumerate(sql_statements, start=1):
                 try:
-                    logger.info(f"DB: Applying migration {idx}/{len(sql_statements)}")
+                    logger.info(f"DB: Applying migration statement {idx}/{len(sql_statements)}")
                     cur.execute(stmt)
-                    logger.info(f"DB: Migration {idx} applied successfully")
+                    logger.info(f"DB: Migration statement {idx} applied successfully")
                 except Exception as e:
-                    logger.error(f"DB: Error applying migration {idx}: {e}")
+                    logger.error(f"DB: Error applying migration statement {idx}: {e}")
+            conn.commit()
         logger.info("DB: All MySQL migrations processed from migrations/*.sql")
     except Exception as e:
         logger.error(f"DB: Error applying MySQL migrations batch: {e}")
@@ -1,7 +1,8 @@
 import os
 import sys
+import queue
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from fastapi import FastAPI
 from .scheduler import start_scheduler
 from .routers.healthApi import router as health_router
@@ -30,20 +31,40 @@ def _configure_logging():
         root = logging.getLogger()
         root.setLevel(logging.INFO)
         # Avoid duplicating handlers if reloaded
-        if not any(isinstance(h, RotatingFileHandler) for h in root.handlers):
-            root.addHandler(file_handler)
-        if not any(isinstance(h, logging.StreamHandler) for h in root.handlers):
-            root.addHandler(stream_handler)
+        if any(isinstance(h, QueueHandler) for h in root.handlers):
+            return None
+        # Formatting and file/stream I/O happen on the listener thread; app
+        # threads only enqueue records, so log calls never block on handler locks
+        log_queue = queue.SimpleQueue()
+        root.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(
+            log_queue, file_handler, stream_handler, respect_handler_level=True
+        )
+        listener.start()
+        return listener
     except Exception:
         # Don't crash on logging setup issues
-        pass
+        return None
 
 
-_configure_logging()
+_log_listener = _configure_logging()
 run_migrations()
 
-# Start scheduler on import (when app starts)
-_scheduler = start_scheduler()
+# Scheduler is started once the event loop is running (AsyncIOScheduler
+# schedules coroutine jobs on the app's loop)
+_scheduler = None
+
+
+@app.on_event("startup")
+async def _startup_scheduler():
+    global _scheduler
+    _scheduler = start_scheduler()
+
+
+@app.on_event("shutdown")
+async def _stop_log_listener():
+    if _log_listener is not None:
+        _log_listener.stop()
 
 app.include_router(health_router)
 app.include_router(jobs_router)
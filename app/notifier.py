@@ -1,18 +1,61 @@
 import os
-import requests
+import time
 from typing import Optional
 
 
+# Created on first send; `requests` is imported lazily so processes that never
+# notify don't pay its import
+_SESSION = None
+
+
+def _get_session():
+    """Return the shared session, creating it (and importing requests) on first use.
+
+    One session means repeated notifications reuse the TCP/TLS connection
+    instead of paying a fresh handshake per message.
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+
+        _SESSION = requests.Session()
+        _SESSION.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=Retry(total=2, backoff_factor=0.2)),
+        )
+    return _SESSION
+
+# Credentials don't change while the process runs; read them once at import
+_TG_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN")
+_TG_CHAT = os.environ.get("TELEGRAM_CHAT_ID")
+_TG_URL = f"https://api.telegram.org/bot{_TG_TOKEN}/sendMessage" if _TG_TOKEN else None
+
+# Circuit breaker: each failed send blocks for up to the request timeout, and
+# spider completion sends 2-3 messages — during a Telegram outage that would
+# add tens of seconds to every run. After 3 consecutive failures we stop
+# trying for 60s instead.
+_BREAKER = {"fails": 0, "open_until": 0.0}
+_BREAKER_THRESHOLD = 3
+_BREAKER_COOLDOWN = 60.0
+
+
 def send_telegram_message(text: str) -> bool:
-    token = os.environ.get("TELEGRAM_BOT_TOKEN")
-    chat_id = os.environ.get("TELEGRAM_CHAT_ID")
-    if not token or not chat_id:
+    if not _TG_URL or not _TG_CHAT:
+        return False
+    if time.monotonic() < _BREAKER["open_until"]:
         return False
     try:
-        url = f"https://api.telegram.org/bot{token}/sendMessage"
-        resp = requests.post(url, json={"chat_id": chat_id, "text": text, "parse_mode": "HTML"}, timeout=10)
-        return resp.ok
+        resp = _get_session().post(_TG_URL, json={"chat_id": _TG_CHAT, "text": text, "parse_mode": "HTML"}, timeout=10)
+        ok = resp.ok
     except Exception:
-        return False
+        ok = False
+    if ok:
+        _BREAKER["fails"] = 0
+    else:
+        _BREAKER["fails"] += 1
+        if _BREAKER["fails"] >= _BREAKER_THRESHOLD:
+            _BREAKER["open_until"] = time.monotonic() + _BREAKER_COOLDOWN
+    return ok
 
 
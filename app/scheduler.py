@@ -1,16 +1,26 @@
 import os
 import logging
+from functools import partial
 from typing import Any, Dict, List
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from .tasks import run_bullseye_spider, run_scrapy_spider
 import yaml
 
 
 def start_scheduler():
-    """Start background scheduler from YAML config or env cron (default: 02:00 IST)."""
+    """Start asyncio scheduler from YAML config or env cron (default: 02:00 IST).
+
+    Must be called with a running event loop (e.g. from FastAPI startup); spider
+    jobs are coroutines supervising child processes, so one loop thread can
+    oversee many concurrent crawls without blocking worker threads.
+    """
     scheduler_tz = os.environ.get("TZ", "UTC")
-    scheduler = BackgroundScheduler(timezone=scheduler_tz)
+    # Coalesce collapses a backlog of missed runs into one
+    scheduler = AsyncIOScheduler(
+        timezone=scheduler_tz,
+        job_defaults={"coalesce": True, "misfire_grace_time": 300},
+    )
     logger = logging.getLogger("scheduler")
     schedules_file = os.environ.get("SCHEDULES_FILE", "jobs.yml")
 
@@ -42,7 +52,8 @@ def start_scheduler():
                     continue
                 if job_type == "spider":
                     logger.info(f"Scheduling spider '{target}' with cron '{cron}' (tz={job_tz})")
-                    add_job_from_cron(job_id, cron, lambda t=target: run_scrapy_spider(t), tz=job_tz)
+                    # partial (not lambda) so APScheduler sees a coroutine function
+                    add_job_from_cron(job_id, cron, partial(run_scrapy_spider, target), tz=job_tz)
                 elif job_type == "bullseye":
                     logger.info(f"Scheduling bullseye spider with cron '{cron}' (tz={job_tz})")
                     add_job_from_cron(job_id, cron, run_bullseye_spider, tz=job_tz)
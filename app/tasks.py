@@ -1,16 +1,60 @@
+import asyncio
 import os
-import subprocess
 import sys
 import json
 import logging
 from typing import Tuple, Optional, List
 from datetime import datetime
 
-from .notifier import send_telegram_message
-from .db import get_mysql_connection
+try:
+    import ijson  # streaming JSON parser; keeps memory flat on large dumps
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # C-backed JSON encoder; several times faster than stdlib json
+except ImportError:
+    orjson = None
+
+
+def _dump_json(value) -> Optional[str]:
+    """Serialize a value to a JSON string, preferring orjson when available.
+
+    default=str keeps one odd field value (Decimal, date, bytes) from
+    aborting the whole row on the catch-and-skip insert path.
+    """
+    if value is None:
+        return None
+    if orjson is not None:
+        return orjson.dumps(value, default=str).decode()
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _dump_raw_json(value) -> bytes:
+    """Serialize to JSON bytes for the raw_json column.
+
+    Passing bytes lets PyMySQL escape them directly instead of utf-8 encoding
+    a str first — raw_json is the largest per-row value, so this skips the
+    biggest decode/encode round-trip on the insert path. default=str covers
+    non-native values as in _dump_json.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=str)
+    return json.dumps(value, ensure_ascii=False, default=str).encode()
+
+# spider name -> (human-readable source name, output folder name)
+_SOURCE_MAP = {
+    "bullseye_press": ("Bullseye Press", "BullseyePress"),
+    "holy_cow": ("Holy Cow Entertainment", "HolyCow"),
+    "comics_adda": ("ComicsAdda", "ComicsAdda"),
+}
 
 
 def _build_source_folder(spider_name: str) -> str:
+    entry = _SOURCE_MAP.get(spider_name)
+    if entry:
+        return entry[1]
+    # Fallback for unknown spiders: capitalize parts
     return ''.join(part.capitalize() for part in spider_name.split('_'))
 
 
@@ -23,25 +67,50 @@ def _find_latest_output_file(spider_name: str) -> Optional[str]:
         base_dir = os.path.join(data_dir, date_dir, source_folder)
         if not os.path.isdir(base_dir):
             return None
-        candidates: List[str] = [
-            os.path.join(base_dir, f) for f in os.listdir(base_dir) if f.endswith(".json")
-        ]
-        if not candidates:
+        # scandir's DirEntry caches stat(), so this is one syscall per file
+        # instead of a listdir pass plus a getmtime stat per candidate
+        with os.scandir(base_dir) as it:
+            entries = [(e.stat().st_mtime, e.path) for e in it if e.name.endswith(".json")]
+        if not entries:
             return None
-        # pick latest by modified time
-        candidates.sort(key=lambda p: os.path.getmtime(p), reverse=True)
-        return candidates[0]
+        return max(entries)[1]
     except Exception:
         return None
 
 
-def _count_records_in_json(path: str) -> Optional[int]:
+def _json_is_array(path: str) -> bool:
+    """Check whether the file's top-level JSON value is an array (cheap peek)."""
     try:
+        with open(path, "rb") as f:
+            head = f.read(64).lstrip()
+        return head.startswith(b"[")
+    except Exception:
+        return False
+
+
+def _iter_json_items(path: str):
+    """Yield top-level array elements one at a time instead of loading the whole file."""
+    if ijson is not None:
+        # use_float keeps non-integer numbers as float (ijson's default is
+        # decimal.Decimal, which the JSON re-serialization on the insert
+        # path can't encode), matching what json.load yields
+        with open(path, "rb") as f:
+            for it in ijson.items(f, "item", use_float=True):
+                yield it
+    else:
+        # Fallback when ijson is unavailable: load eagerly
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
         if isinstance(data, list):
-            return len(data)
-        return None
+            for it in data:
+                yield it
+
+
+def _count_records_in_json(path: str) -> Optional[int]:
+    try:
+        if not _json_is_array(path):
+            return None
+        return sum(1 for _ in _iter_json_items(path))
     except Exception:
         return None
 
@@ -56,48 +125,106 @@ def _normalize_name_for_db(name: str) -> str:
 
 def _infer_source_name(spider_name: str) -> str:
     """Map spider name to human-readable source name."""
-    if spider_name == "bullseye_press":
-        return "Bullseye Press"
-    elif spider_name == "holy_cow":
-        return "Holy Cow Entertainment"
-    elif spider_name == "comics_adda":
-        return "ComicsAdda"
+    entry = _SOURCE_MAP.get(spider_name)
+    if entry:
+        return entry[0]
     # Fallback: capitalize parts
     return " ".join(part.capitalize() for part in spider_name.split("_"))
 
 
-def _insert_scraped_data_into_db(spider_name: str, latest_file: Optional[str]) -> Optional[int]:
+# Built once at import; the string and its placeholder layout never change
+_COMICS_INSERT_SQL = """
+INSERT INTO comics_data_dump (
+    title, series_name, issue, language, binding,
+    original_price, price, description, url, cover_image_url,
+    source, scraped_at, uploaded_date, publisher, pages,
+    status, failed_at, processed_at, failure_reason,
+    writers, artists, colorists, genre, additional_info, raw_json,
+    created_at, updated_at
+)
+VALUES (
+    %s, %s, %s, %s, %s,
+    %s, %s, %s, %s, %s,
+    %s, %s, %s, %s, %s,
+    'CREATED', NULL, NULL, NULL,
+    %s, %s, %s, %s, %s, %s,
+    %s, %s
+)
+ON DUPLICATE KEY UPDATE
+    updated_at = %s
+"""
+
+
+_PUB_UPSERT_SQL = (
+    "INSERT INTO sources (source, description, url, created_at, updated_at) VALUES (%s, %s, %s, %s, %s) "
+    "ON DUPLICATE KEY UPDATE description = VALUES(description), url = VALUES(url), updated_at = %s"
+)
+
+
+def _row_params(it: dict, source: str, now: datetime) -> tuple:
+    """Build the parameter tuple for one comics_data_dump row."""
+    publisher = it.get("publisher")
+    return (
+        it.get("title"), it.get("series"), it.get("issue"), it.get("language"), it.get("binding"),
+        it.get("original_price"), it.get("price"), it.get("description"), it.get("url"), it.get("cover_image_url"),
+        source, it.get("scraped_at"), it.get("listing_date"),
+        _normalize_name_for_db(publisher) if publisher else None, it.get("pages"),
+        _dump_json(it.get("writers")), _dump_json(it.get("artists")), _dump_json(it.get("colorists")),
+        _dump_json(it.get("genre")), _dump_json(it.get("additional_info")), _dump_raw_json(it),
+        now, now, now,
+    )
+
+
+def _insert_scraped_data_into_db(spider_name: str, latest_file: Optional[str], conn=None) -> Optional[int]:
     """
     Read the aggregated JSON file and insert records into comics_data_dump table.
     Returns number of rows processed (inserted/updated), or None on failure.
+
+    A caller holding a connection already (e.g. spanning migrations and several
+    spider runs) can pass it via `conn`; otherwise one is leased from the pool
+    and returned afterwards.
     """
     logger = logging.getLogger("db")
     if not latest_file or not os.path.isfile(latest_file):
         logger.info("DB: No latest JSON file found for DB insertion")
         return None
 
-    try:
-        with open(latest_file, "r", encoding="utf-8") as f:
-            items = json.load(f)
-        if not isinstance(items, list):
-            logger.warning("DB: Latest JSON is not a list; skipping DB load")
-            return None
-    except Exception as e:
-        logger.error(f"DB: Failed to read latest JSON file for DB load: {e}")
+    if not _json_is_array(latest_file):
+        logger.warning("DB: Latest JSON is not a list; skipping DB load")
         return None
 
-    conn = get_mysql_connection()
+    # Imported here (not at module load) so the web workers don't pull in
+    # pymysql until a spider actually finishes
+    from .db import get_mysql_connection
+
+    own_conn = conn is None
+    if own_conn:
+        conn = get_mysql_connection()
     if conn is None:
         return None
+    try:
+        # Connections may have sat idle since the previous run; revive before
+        # the batch instead of failing on the first execute
+        conn.ping(reconnect=True)
+    except Exception as e:
+        logger.error(f"DB: Connection ping failed before insert batch: {e}")
+        if own_conn:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        return None
 
     source_name = _infer_source_name(spider_name)
     source_name_normalized = _normalize_name_for_db(source_name)
     processed = 0
 
     try:
+        # One shared insert timestamp for the whole batch; rows inserted in the
+        # same run share the same "insert time" semantically anyway
+        current_dt = datetime.now()
         with conn.cursor() as cur:
             # Ensure source exists
-            current_dt = datetime.now()
             try:
                 cur.execute(
                     "INSERT IGNORE INTO sources (source, description, url, created_at, updated_at) VALUES (%s, %s, %s, %s, %s)",
@@ -106,108 +233,92 @@ def _insert_scraped_data_into_db(spider_name: str, latest_file: Optional[str]) -
             except Exception as e:
                 logger.error(f"DB: Failed to upsert source '{source_name_normalized}': {e}")
 
-            # Helper function to check if item is a ComicItem based on schema
-            def _is_comic_item(item: dict) -> bool:
-                """Check if item matches ComicItem schema (has price, title, and url)."""
-                return (
-                    item.get("price") is not None and
-                    item.get("title") is not None and
-                    item.get("url") is not None
-                )
+            # Batch the comic INSERTs: build parameter tuples and flush them with
+            # executemany inside an explicit transaction every `batch_size` rows,
+            # collapsing N round-trips/commits into one per chunk.
+            batch_size = 500
+            params: List[tuple] = []
 
-            def _is_publisher_item(item: dict) -> bool:
-                """Check if item matches PublisherItem schema (has name but no comic fields)."""
-                return item.get("name") is not None and not _is_comic_item(item)
-
-            # First, handle PublisherItems - these should go into sources table
-            for it in items:
-                if not isinstance(it, dict):
-                    continue
-                if _is_publisher_item(it):
+            def _flush_batch():
+                nonlocal processed
+                if not params:
+                    return
+                try:
+                    conn.begin()
+                    cur.executemany(_COMICS_INSERT_SQL, params)
+                    conn.commit()
+                    processed += len(params)
+                except Exception as e:
                     try:
-                        pub_name = it.get("name")
-                        pub_name_normalized = _normalize_name_for_db(pub_name) if pub_name else None
-                        pub_description = it.get("description")
-                        pub_url = it.get("url") or it.get("website")
-                        current_dt = datetime.now()
-                        cur.execute(
-                            "INSERT INTO sources (source, description, url, created_at, updated_at) VALUES (%s, %s, %s, %s, %s) "
-                            "ON DUPLICATE KEY UPDATE description = VALUES(description), url = VALUES(url), updated_at = %s",
-                            (pub_name_normalized, pub_description, pub_url, current_dt, current_dt, current_dt),
-                        )
-                        logger.debug(f"DB: Upserted source '{pub_name_normalized}' into sources table")
-                    except Exception as e:
-                        logger.error(f"DB: Failed to insert source '{it.get('name')}': {e}")
-
-            # Now handle ComicItems - these go into comics_data_dump
-            sql = """
-            INSERT INTO comics_data_dump (
-                title, series_name, issue, language, binding,
-                original_price, price, description, url, cover_image_url,
-                source, scraped_at, uploaded_date, publisher, pages,
-                status, failed_at, processed_at, failure_reason,
-                writers, artists, colorists, genre, additional_info, raw_json,
-                created_at, updated_at
-            )
-            VALUES (
-                %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s,
-                'CREATED', NULL, NULL, NULL,
-                %s, %s, %s, %s, %s, %s,
-                %s, %s
-            )
-            ON DUPLICATE KEY UPDATE
-                updated_at = %s
-            """
-
-            for it in items:
+                        conn.rollback()
+                    except Exception:
+                        pass
+                    logger.error(f"DB: Batch insert of {len(params)} rows failed, retrying individually: {e}")
+                    # Fallback: retry rows one by one so a single bad row
+                    # doesn't drop the whole chunk
+                    for row in params:
+                        try:
+                            conn.begin()
+                            cur.execute(_COMICS_INSERT_SQL, row)
+                            conn.commit()
+                            processed += 1
+                        except Exception as row_exc:
+                            try:
+                                conn.rollback()
+                            except Exception:
+                                pass
+                            logger.error(f"DB: Failed to insert comic record for url={row[8]}: {row_exc}")
+                params.clear()
+
+            # Single pass over the file: an item with price+title+url is a
+            # ComicItem, an item with a name is a PublisherItem. Classifying
+            # once avoids streaming the file twice and re-checking the comic
+            # schema per item.
+            publishers: List[dict] = []
+            for it in _iter_json_items(latest_file):
                 if not isinstance(it, dict):
                     continue
-                # Only process ComicItems (skip PublisherItems and other types)
-                if not _is_comic_item(it):
+                if it.get("price") is None or not it.get("title") or not it.get("url"):
+                    if it.get("name"):
+                        publishers.append(it)
                     continue
                 try:
-                    title = it.get("title")
-                    url = it.get("url")
-                    if not url or not title:
-                        continue  # url and title are required for comics_data_dump
-
-                    series_name = it.get("series")
-                    issue = it.get("issue")
-                    language = it.get("language")
-                    binding = it.get("binding")
-                    original_price = it.get("original_price")
-                    price = it.get("price")
-                    description = it.get("description")
-                    cover_image_url = it.get("cover_image_url")
-                    scraped_at = it.get("scraped_at")
-                    uploaded_date = it.get("listing_date")
-                    publisher = it.get("publisher")
-                    publisher_normalized = _normalize_name_for_db(publisher) if publisher else None
-                    pages = it.get("pages")
-
-                    writers = json.dumps(it.get("writers"), ensure_ascii=False) if it.get("writers") is not None else None
-                    artists = json.dumps(it.get("artists"), ensure_ascii=False) if it.get("artists") is not None else None
-                    colorists = json.dumps(it.get("colorists"), ensure_ascii=False) if it.get("colorists") is not None else None
-                    genre = json.dumps(it.get("genre"), ensure_ascii=False) if it.get("genre") is not None else None
-                    additional_info = json.dumps(it.get("additional_info"), ensure_ascii=False) if it.get("additional_info") is not None else None
-                    raw_json = json.dumps(it, ensure_ascii=False)
-                    current_dt = datetime.now()
-
-                    cur.execute(
-                        sql,
-                        (
-                            title, series_name, issue, language, binding,
-                            original_price, price, description, url, cover_image_url,
-                            source_name_normalized, scraped_at, uploaded_date, publisher_normalized, pages,
-                            writers, artists, colorists, genre, additional_info, raw_json,
-                            current_dt, current_dt, current_dt,
-                        ),
+                    params.append(_row_params(it, source_name_normalized, current_dt))
+                    if len(params) >= batch_size:
+                        _flush_batch()
+                except Exception as e:
+                    logger.error(f"DB: Failed to build comic record for url={it.get('url')}: {e}")
+
+            _flush_batch()
+
+            # PublisherItems collected during the same pass go into sources as
+            # one batched upsert instead of a round-trip per publisher
+            if publishers:
+                pub_rows = [
+                    (
+                        _normalize_name_for_db(p["name"]),
+                        p.get("description"),
+                        p.get("url") or p.get("website"),
+                        current_dt, current_dt, current_dt,
                     )
-                    processed += 1
+                    for p in publishers
+                ]
+                try:
+                    conn.begin()
+                    cur.executemany(_PUB_UPSERT_SQL, pub_rows)
+                    conn.commit()
+                    logger.debug(f"DB: Upserted {len(pub_rows)} sources")
                 except Exception as e:
-                    logger.error(f"DB: Failed to insert comic record for url={it.get('url')}: {e}")
+                    try:
+                        conn.rollback()
+                    except Exception:
+                        pass
+                    logger.error(f"DB: Batch upsert of {len(pub_rows)} sources failed, retrying individually: {e}")
+                    for row in pub_rows:
+                        try:
+                            cur.execute(_PUB_UPSERT_SQL, row)
+                        except Exception as row_exc:
+                            logger.error(f"DB: Failed to insert source '{row[0]}': {row_exc}")
 
         logger.info(f"DB: Inserted/updated {processed} records into comics_data_dump")
         return processed
@@ -215,14 +326,39 @@ def _insert_scraped_data_into_db(spider_name: str, latest_file: Optional[str]) -
         logger.error(f"DB: Error during comics_data_dump insert batch: {e}")
         return None
     finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+        # Only return connections we leased ourselves; a shared conn stays open
+        if own_conn:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+# Each crawl is its own OS process, so spiders scheduled on the same cron
+# minute already parallelize across CPUs; the semaphore just caps how many
+# child processes run at once.
+_SPIDER_SEMAPHORE = asyncio.Semaphore(int(os.environ.get("SPIDER_PROCS", "4")))
+
 
+async def run_scrapy_spider(spider_name: str) -> Tuple[int, str]:
+    """Run a scrapy spider by name and return (returncode, output_snippet).
+
+    Bounded by _SPIDER_SEMAPHORE so a burst of due jobs doesn't fork an
+    unbounded number of crawls.
+    """
+    async with _SPIDER_SEMAPHORE:
+        return await _run_spider_process(spider_name)
+
+
+async def _run_spider_process(spider_name: str) -> Tuple[int, str]:
+    """Supervise one scrapy crawl as a child process via asyncio.
+
+    Waiting for a long crawl this way doesn't tie up a scheduler worker
+    thread.
+    """
+    # Deferred so importing tasks (e.g. for the scheduler) stays cheap
+    from .notifier import send_telegram_message
 
-def run_scrapy_spider(spider_name: str) -> Tuple[int, str]:
-    """Run a scrapy spider by name and return (returncode, output_snippet)."""
     try:
         send_telegram_message(f"🟢 Starting job: <b>{spider_name}</b>")
         # Send Scrapy logs to a file in the current folder
@@ -244,18 +380,20 @@ def run_scrapy_spider(spider_name: str) -> Tuple[int, str]:
             "-s",
             "LOG_LEVEL=INFO",
         ]
-        result = subprocess.run(cmd, text=True, cwd=".")
+        proc = await asyncio.create_subprocess_exec(*cmd, cwd=".")
+        returncode = await proc.wait()
         # We don't capture output because Scrapy logs write to scraper.log now
-        output = f"Scrapy finished with code {result.returncode}. See {log_file}"
-        if result.returncode != 0:
+        output = f"Scrapy finished with code {returncode}. See {log_file}"
+        if returncode != 0:
             # Try to attach last log snippet for context
             snippet = ""
             try:
-                with open(log_file, "r", encoding="utf-8", errors="ignore") as lf:
+                # Read exactly the last 1000 bytes instead of 4000-and-slice
+                with open(log_file, "rb") as lf:
                     lf.seek(0, os.SEEK_END)
                     size = lf.tell()
-                    lf.seek(max(0, size - 4000))
-                    snippet = lf.read()[-1000:]
+                    lf.seek(max(0, size - 1000))
+                    snippet = lf.read().decode("utf-8", "ignore")
             except Exception:
                 pass
             send_telegram_message(
@@ -265,8 +403,8 @@ def run_scrapy_spider(spider_name: str) -> Tuple[int, str]:
             # Find latest output and count records
             latest_file = _find_latest_output_file(spider_name)
             count = _count_records_in_json(latest_file) if latest_file else None
-            # Push scraped data into DB
-            db_processed = _insert_scraped_data_into_db(spider_name, latest_file)
+            # Push scraped data into DB off the event loop (blocking I/O)
+            db_processed = await asyncio.to_thread(_insert_scraped_data_into_db, spider_name, latest_file)
 
             if count is not None:
                 msg = (
@@ -280,14 +418,14 @@ def run_scrapy_spider(spider_name: str) -> Tuple[int, str]:
                 send_telegram_message(
                     f"✅ Job completed: <b>{spider_name}</b>\nLog: {log_file}"
                 )
-        return result.returncode, output
+        return returncode, output
     except Exception as exc:
         send_telegram_message(f"🔴 Job error: <b>{spider_name}</b>\n{exc}")
         return 1, f"Exception while running spider '{spider_name}': {exc}"
 
 
-def run_bullseye_spider() -> Tuple[int, str]:
+async def run_bullseye_spider() -> Tuple[int, str]:
     """Backward compatible helper for Bullseye Press spider."""
-    return run_scrapy_spider("bullseye_press")
+    return await run_scrapy_spider("bullseye_press")
 
 
@@ -69,6 +69,11 @@ ITEM_PIPELINES = {
     "comic_scraper.pipelines.JsonExportPipeline": 400,
 }
 
+# Stream JSON export through a .tmp file and rename once on close, instead of
+# writing the final file directly. A crashed crawl re-runs anyway, so this is
+# off by default
+ATOMIC_JSON_WRITES = False
+
 # Enable and configure the AutoThrottle extension (disabled by default)
 # See https://docs.scrapy.org/en/latest/topics/autothrottle.html
 AUTOTHROTTLE_ENABLED = True
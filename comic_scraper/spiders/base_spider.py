@@ -18,6 +18,9 @@ class BaseComicSpider(scrapy.Spider):
     def __init__(self, *args, **kwargs):
         super(BaseComicSpider, self).__init__(*args, **kwargs)
         self.scraped_at = get_current_timestamp()
+        # Output folder name (e.g. bullseye_press -> BullseyePress), computed
+        # once so pipelines don't rebuild it from the spider name
+        self.source_folder = ''.join(word.capitalize() for word in self.name.split('_'))
     
     def add_scraped_timestamp(self, item):
         """Add timestamp to item"""
@@ -27,11 +30,28 @@ class BaseComicSpider(scrapy.Spider):
     
     def clean_item(self, item):
         """Clean item fields"""
-        for field_name, field_value in item.items():
-            if isinstance(field_value, str):
+        # type() check instead of isinstance(): field values are plain str,
+        # never str subclasses, and the exact-type test is faster per field
+        for field_name in item.keys():
+            field_value = item[field_name]
+            if type(field_value) is str:
                 item[field_name] = clean_text(field_value)
         return item
     
+    def _finalize(self, item):
+        """Stamp scraped_at and strip string fields in one pass over the item
+
+        Combines add_scraped_timestamp() and clean_item() so yield sites walk
+        the fields once instead of twice.
+        """
+        if hasattr(item, 'fields') and 'scraped_at' in item.fields:
+            item['scraped_at'] = self.scraped_at
+        for field_name in item.keys():
+            field_value = item[field_name]
+            if type(field_value) is str:
+                item[field_name] = clean_text(field_value)
+        return item
+
     def parse_error(self, response, error_msg="Failed to parse"):
         """Log parsing errors"""
         self.logger.error(f"{error_msg}: {response.url}")
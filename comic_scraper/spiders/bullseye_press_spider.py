@@ -6,7 +6,79 @@ from comic_scraper.spiders.base_spider import BaseComicSpider
 from comic_scraper.items import PublisherItem, ComicItem, SeriesItem, ArtistItem
 from comic_scraper.utils.helpers import clean_text, normalize_list, extract_numbers, parse_date
 from comic_scraper.constants import MIN_PAGES, MAX_PAGES
+from urllib.parse import urljoin
+import hashlib
+import os
 import re
+import sqlite3
+
+try:
+    from pybloom_live import ScalableBloomFilter
+    BLOOM_AVAILABLE = True
+except ImportError:
+    BLOOM_AVAILABLE = False
+
+
+# Compiled once at import: the page patterns run on every listing URL and the
+# rest run on every product title, so don't rely on re's bounded pattern cache
+def _url_key(url):
+    """Stable 63-bit integer key for a URL (hash() is salted per process)"""
+    digest = hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') >> 1
+
+
+_LANG_MID_RE = re.compile(r'\s+(?:English|Hindi)\s+', re.IGNORECASE)
+# Single alternation covering every trailing language/format suffix; applied
+# to a fixed point so stacked suffixes ("Hindi Variant Cover Issue") all go
+_SERIES_CLEAN_RE = re.compile(
+    r'\s+(?:English|Hindi|Issue|Hardcover|Paperback|Variant(?:\s+Cover)?'
+    r'|Regular\s+Cover|Combo(?:\s+Issue)?)(?:\s+(?:Hardcover|Paperback))?\s*$',
+    re.IGNORECASE,
+)
+# Patterns run once (or more) per product page in parse_product_detail
+_SERIES_PREFIX_RE = re.compile(r'^([^–\-0-9]+)')
+_TRAILING_META_RE = re.compile(r'\s*(Writer|Art|Pages|Category).*$', re.IGNORECASE)
+_UPLOAD_DATE_RE = re.compile(r'/wp-content/uploads/(\d{4})/(\d{1,2})/')
+_NUM_SCAN_RE = re.compile(r'\b(\d+)\b')
+# Standalone number (plus optional punctuation) at the very end of the
+# description, e.g. "Art by Name Name 64."
+_TRAILING_NUM_RE = re.compile(r'(\d+)[.,;:!?]?\s*$')
+_DESC_ARTIST_RES = (
+    re.compile(r'\b(?:by|artist|art by|artwork by|illustrated by|drawn by)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)', re.IGNORECASE),
+    re.compile(r'(?:artist|artwork|illustrator)[:\s]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)', re.IGNORECASE),
+)
+_META_ARTIST_RE = re.compile(
+    r'\b(?:artist|art|art by|artwork by|illustrated by|drawn by)[:\s]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
+    re.IGNORECASE,
+)
+# Candidate artist names that are really cache/UI noise or format words;
+# matched as substrings against pre-lowered candidates, so one compiled
+# alternation replaces ~28 Python-level scans per candidate
+_INVALID_KEYWORDS = (
+    'litespeed', 'cache', 'comments', 'feed', 'quantity',
+    'logged', 'customers', 'purchased', 'product', 'review',
+    'there', 'are', 'no', 'reviews', 'yet', 'only', 'may', 'leave',
+    'hand', 'painted', 'variant', 'cover', 'wraparound', 'poster',
+    'homage', 'action', 'figure', 'regular', 'hardbound', 'paperback',
+    'hardcover', 'english', 'hindi', 'issue', 'shot', 'one',
+)
+_COVER_ARTIST_RES = (
+    re.compile(r'cover\s+(?:by|artist)[:\s]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', re.IGNORECASE),
+    re.compile(r'variant\s+by\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', re.IGNORECASE),
+)
+# Cleaned series names that are really just leftover format/language noise
+_INVALID_SERIES = frozenset({
+    'Issue', 'issue', 'English', 'Hindi', 'Variant Cover', 'Variant',
+    'Regular Cover', 'Issue 2', 'Issue 3', 'Issue 1-4', 'Combo of',
+    'English Hardcover', 'Hindi Hardcover', 'English Paperback', 'Hindi Paperback',
+})
+# Text that's clearly not description (like "Add to cart", "Wishlist", etc.);
+# one alternation scan instead of 11 substring tests per text chunk
+_SKIP_RE = re.compile(
+    r'add to cart|wishlist|share|category|reviews|logged in customers'
+    r'|writer|art|pages|quantity|there are no reviews|only logged in',
+    re.IGNORECASE,
+)
 
 
 class BullseyePressSpider(BaseComicSpider):
@@ -23,27 +95,118 @@ class BullseyePressSpider(BaseComicSpider):
     start_urls = ['https://bullseyepress.in/shop/']
     
     custom_settings = {
-        'DOWNLOAD_DELAY': 2,
-        'RANDOMIZE_DOWNLOAD_DELAY': 0.5,
-        'CONCURRENT_REQUESTS_PER_DOMAIN': 2,
+        # AutoThrottle adapts the delay to observed latency instead of a fixed
+        # DOWNLOAD_DELAY=2, so fast responses aren't padded to 2s each
+        'AUTOTHROTTLE_ENABLED': True,
+        'AUTOTHROTTLE_START_DELAY': 1.0,
+        'AUTOTHROTTLE_MAX_DELAY': 10.0,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 2.0,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 4,
+        # Jitter the per-slot delay so concurrent crawl runs don't line up
+        # their requests; AutoThrottle still adapts the base delay
+        'DOWNLOAD_SLOTS': {
+            'bullseyepress.in': {
+                'concurrency': 2,
+                'delay': 1.0,
+                'randomize_delay': True,
+            },
+        },
+        'RETRY_HTTP_CODES': [429, 502, 503, 504],
         'ROBOTSTXT_OBEY': False,  # Some sites don't have proper robots.txt
     }
-    
+
+    # Parse-time patterns bound at class-definition time, so their lifetime is
+    # tied to the class (compiled once even if the module is reloaded) and
+    # subclasses can override them
+    _PAGE_ANY_RE = re.compile(r'(?:/page/|[?&]paged?=)(\d+)')
+    _LANG_RE = re.compile(r'\b(Hindi|English|हिंदी|Eng|Hin)\b', re.IGNORECASE)
+    _LANG_MAP = {
+        'hindi': 'Hindi',
+        'hin': 'Hindi',
+        'हिंदी': 'Hindi',
+        'english': 'English',
+        'eng': 'English',
+    }
+    # One alternation for all binding variants; the named group that matched
+    # identifies the normalized value via _BINDING_MAP
+    _BINDING_RE = re.compile(
+        r'\b(?:(?P<hardbound>hardbound|hard\s*bound)|(?P<paperback>paperback|paper\s*back)'
+        r'|(?P<hardcover>hardcover|hard\s*cover)|(?P<softcover>softcover|soft\s*cover))\b',
+        re.IGNORECASE,
+    )
+    _BINDING_MAP = {
+        'hardbound': 'Hardbound',
+        'paperback': 'Paperback',
+        'hardcover': 'Hardcover',
+        'softcover': 'Softcover',
+    }
+    # Both explicit page-count spellings ("64 pages" and "Pages: 64") in one
+    # alternation; whichever group matched carries the number
+    _PAGE_COUNT_RE = re.compile(
+        r'\b(\d+)\s*(?:pages?|pgs?|p\.?)\b|(?:pages?|pgs?)[:\s]+(\d+)\b',
+        re.IGNORECASE,
+    )
+    _BY_TITLE_RE = re.compile(r'\bby\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)', re.IGNORECASE)
+    _BY_URL_RE = re.compile(r'-by-([a-z]+(?:-[a-z]+)+)', re.IGNORECASE)
+    _INVALID_RE = re.compile('|'.join(map(re.escape, _INVALID_KEYWORDS)))
+    # Review boilerplate that WooCommerce appends after the real description
+    _REVIEW_STRIP_RE = re.compile(
+        r'(?:There are no reviews yet|Only logged in customers).*',
+        re.IGNORECASE | re.DOTALL,
+    )
+
+    # Description extraction: one comma-joined CSS pass over every known
+    # location plus one XPath for heading-sibling layouts, instead of separate
+    # per-theme selector calls that each re-walk the tree
+    _DESC_CSS = (
+        '.woocommerce-product-details__short-description p::text, '
+        '.product-short-description p::text, '
+        '.woocommerce-Tabs-panel--description p::text, '
+        '.woocommerce-tabs .description p::text'
+    )
+    _DESC_XPATH = (
+        '(//h2[contains(text(), "Description")] | //h3[contains(text(), "Description")])'
+        '/following-sibling::*[1]//p/text()'
+    )
+    # Fallbacks take direct text when no paragraphs were found
+    _DESC_FALLBACK_CSS = (
+        '.woocommerce-product-details__short-description::text, '
+        '.product-short-description::text, '
+        '.woocommerce-Tabs-panel--description::text, '
+        '.woocommerce-tabs .description::text'
+    )
+    _DESC_FALLBACK_XPATH = (
+        '(//h2[contains(text(), "Description")] | //h3[contains(text(), "Description")])'
+        '/following-sibling::*[1]//text()'
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.visited_urls = set()
+        # Bloom filter instead of a set of full URL strings: ~10 bits per URL
+        # rather than ~150 bytes. The 1e-6 false-positive rate means at worst
+        # one real product in a million is skipped, which is fine for a scraper
+        if BLOOM_AVAILABLE:
+            self.visited_urls = ScalableBloomFilter(
+                initial_capacity=10_000, error_rate=1e-6
+            )
+        else:
+            self.visited_urls = set()
         self.publisher_yielded = False
-        self.got_404 = False  # Flag to track if we got a 404 error
+        # Persistent record of products already scraped in earlier runs, so a
+        # re-crawl only pays for new products instead of the whole catalog
+        os.makedirs('data', exist_ok=True)
+        self._visited_db = sqlite3.connect(os.path.join('data', f'{self.name}_visited.db'))
+        self._visited_db.execute('CREATE TABLE IF NOT EXISTS v(h INTEGER PRIMARY KEY)')
+        self._visited_db.commit()
     
     def parse(self, response):
         """
         Parse the shop page and extract comic listings.
         Also extract publisher information.
         """
-        # Check for 404 error - stop pagination if we get 404
+        # Nothing to do on a 404 page
         if response.status == 404:
-            self.got_404 = True
-            self.logger.warning(f"Got 404 error on {response.url}, stopping pagination")
+            self.logger.warning(f"Got 404 error on {response.url}")
             return
         
         # Extract publisher information only once
@@ -51,62 +214,53 @@ class BullseyePressSpider(BaseComicSpider):
             yield self.extract_publisher_info(response)
             self.publisher_yielded = True
         
-        # Multiple strategies to find product links
-        product_links = set()
-        
-        # Strategy 1: Find all product links using various WooCommerce selectors
-        product_selectors = [
-            'li.product a::attr(href)',
-            '.product a::attr(href)',
-            'article.product a::attr(href)',
-            '.woocommerce-loop-product__link::attr(href)',
-            '.woocommerce ul.products li.product a::attr(href)',
-            '.products li.product a::attr(href)',
-            'a.woocommerce-LoopProduct-link::attr(href)',
-            '.product-item a::attr(href)',
-            'a[href*="/product/"]::attr(href)',
-        ]
-        
-        for selector in product_selectors:
-            links = response.css(selector).getall()
-            for link in links:
-                if link and '/product/' in link:
-                    full_url = response.urljoin(link)
-                    if full_url not in self.visited_urls:
-                        product_links.add(full_url)
-        
-        # Strategy 2: Find all links that contain /product/ in the URL
-        all_links = response.css('a::attr(href)').getall()
-        for link in all_links:
+        # Find product links: a single scan over every href subsumes the old
+        # per-theme WooCommerce selectors, since they all matched /product/
+        # URLs. Yield each request as soon as the link is discovered so the
+        # downloader starts on product pages while the listing is still being
+        # scanned; marking the URL visited immediately also dedupes within the
+        # page. Scrapy's own dupefilter backstops dedup now that dont_filter
+        # is gone
+        # response.urljoin re-parses the response URL on every call; most
+        # WooCommerce hrefs are already absolute, so join manually only when
+        # needed against the URL string held once in a local
+        base = response.url
+        visited = self.visited_urls
+        products_found = 0
+        for link in response.css('a::attr(href)').getall():
             if link and '/product/' in link:
-                full_url = response.urljoin(link)
-                if full_url not in self.visited_urls and full_url not in product_links:
-                    product_links.add(full_url)
-        
-        self.logger.info(f"Found {len(product_links)} product links on {response.url}")
-        
-        # Follow all product links
-        for product_link in product_links:
-            self.visited_urls.add(product_link)
-            yield response.follow(
-                product_link,
-                callback=self.parse_product_detail,
-                dont_filter=True
-            )
-        
-        # Stop pagination if no products found on a paginated page
-        if not product_links and '/page/' in response.url:
-            self.logger.info(f"No products found on {response.url}, stopping pagination")
-            return
-        
+                full_url = link if link.startswith('http') else urljoin(base, link)
+                if full_url not in visited:
+                    visited.add(full_url)
+                    # Count the link for pagination purposes even when a past
+                    # run already scraped it, but skip the request
+                    products_found += 1
+                    if self._visited_db.execute(
+                        'SELECT 1 FROM v WHERE h=?', (_url_key(full_url),)
+                    ).fetchone():
+                        continue
+                    yield response.follow(
+                        full_url,
+                        callback=self.parse_product_detail
+                    )
+
+        self.logger.info(f"Found {products_found} product links on {response.url}")
+
         # Only handle pagination if we found products on this page
-        if not product_links:
+        if not products_found:
             self.logger.info(f"No products found on {response.url}, skipping pagination")
             return
         
         # Handle pagination - only follow links that actually exist on the page
         pagination_links = set()
-        
+
+        # Current page number, computed once and shared by the strategies below
+        current_page = 1
+        page_match = self._PAGE_ANY_RE.search(response.url)
+        if page_match:
+            current_page = int(page_match.group(1))
+
+
         # Strategy 1: Next page link (most reliable - only exists if there's a next page)
         next_selectors = [
             'a.next::attr(href)',
@@ -119,92 +273,35 @@ class BullseyePressSpider(BaseComicSpider):
         for selector in next_selectors:
             next_link = response.css(selector).get()
             if next_link:
-                full_url = response.urljoin(next_link)
+                full_url = next_link if next_link.startswith('http') else urljoin(base, next_link)
                 # Make sure it's a valid URL and not already visited
-                if full_url and full_url not in self.visited_urls and full_url != response.url:
+                if full_url and full_url not in visited and full_url != response.url:
                     pagination_links.add(full_url)
                     break  # Found a next link, no need to check other selectors
         
         # Strategy 2: Get page number links, but only if they're greater than current page
         # This prevents going backwards or to invalid pages
         if not pagination_links:
-            # Extract current page number
-            current_page = 1
-            page_match = re.search(r'/page/(\d+)/?', response.url)
-            if page_match:
-                current_page = int(page_match.group(1))
-            else:
-                page_match = re.search(r'[?&]paged?=(\d+)', response.url)
-                if page_match:
-                    current_page = int(page_match.group(1))
-            
-            # Get all page number links
-            page_number_selectors = [
-                '.page-numbers a::attr(href)',
-                '.woocommerce-pagination a::attr(href)',
-                '.pagination a::attr(href)',
-                'nav.pagination a::attr(href)',
-            ]
-            for selector in page_number_selectors:
-                links = response.css(selector).getall()
-                for link in links:
-                    if not link:
-                        continue
-                    full_url = response.urljoin(link)
-                    if full_url == response.url or full_url in self.visited_urls:
-                        continue
-                    
-                    # Extract page number from the link
-                    link_page_match = re.search(r'/page/(\d+)/?', full_url)
-                    if not link_page_match:
-                        link_page_match = re.search(r'[?&]paged?=(\d+)', full_url)
-                    
-                    if link_page_match:
-                        link_page = int(link_page_match.group(1))
-                        # Only follow if it's the next page or a future page (not past pages)
-                        if link_page > current_page:
-                            pagination_links.add(full_url)
-                            break  # Found a valid next page link
-        
-        # Strategy 4: Construct next page URL manually if no pagination links found
-        # This ensures we continue pagination even if links aren't detected
-        if not pagination_links:
-            # Extract current page number
-            current_page = 1
-            base_url = response.url.split('?')[0].rstrip('/')
-            
-            # Check if URL contains page number
-            page_match = re.search(r'/page/(\d+)/?', response.url)
-            if page_match:
-                current_page = int(page_match.group(1))
-                # Remove /page/X/ from base URL
-                base_url = re.sub(r'/page/\d+/?$', '', base_url)
-            else:
-                page_match = re.search(r'[?&]paged?=(\d+)', response.url)
-                if page_match:
-                    current_page = int(page_match.group(1))
-            
-            # Construct next page URL
-            next_page = current_page + 1
-            
-            # Handle different base URL patterns
-            if '/shop' in base_url:
-                # If base URL contains /shop, construct /shop/page/X/ or /page/X/
-                if base_url.endswith('/shop'):
-                    next_page_url = f"{base_url}/page/{next_page}/"
-                elif base_url.endswith('/shop/'):
-                    next_page_url = f"{base_url}page/{next_page}/"
-                else:
-                    # Remove /shop/ and add /page/X/
-                    base_without_shop = base_url.replace('/shop', '').rstrip('/')
-                    next_page_url = f"{base_without_shop}/page/{next_page}/"
-            else:
-                # Default: add /page/2/ etc. to root
-                next_page_url = f"{base_url}/page/{next_page}/"
-            
-            if next_page_url not in self.visited_urls and next_page_url != response.url:
-                pagination_links.add(next_page_url)
-                self.logger.info(f"Constructed next page URL: {next_page_url}")
+            # Get all page number links (one comma-joined selector, one tree walk)
+            links = response.css(
+                '.page-numbers a::attr(href), .woocommerce-pagination a::attr(href), '
+                '.pagination a::attr(href), nav.pagination a::attr(href)'
+            ).getall()
+            for link in links:
+                if not link:
+                    continue
+                full_url = link if link.startswith('http') else urljoin(base, link)
+                if full_url == response.url or full_url in visited:
+                    continue
+
+                # Extract page number from the link
+                link_page_match = self._PAGE_ANY_RE.search(full_url)
+                if link_page_match:
+                    link_page = int(link_page_match.group(1))
+                    # Only follow if it's the next page or a future page (not past pages)
+                    if link_page > current_page:
+                        pagination_links.add(full_url)
+                        break  # Found a valid next page link
         
         # Strategy 3: Load more button (AJAX pagination) - only if it exists
         if not pagination_links:
@@ -217,41 +314,49 @@ class BullseyePressSpider(BaseComicSpider):
             for selector in load_more_selectors:
                 load_more = response.css(selector).get()
                 if load_more:
-                    full_url = response.urljoin(load_more)
-                    if full_url and full_url not in self.visited_urls and full_url != response.url:
+                    full_url = load_more if load_more.startswith('http') else urljoin(base, load_more)
+                    if full_url and full_url not in visited and full_url != response.url:
                         pagination_links.add(full_url)
                         break
         
-        # Only follow pagination if we found a valid next page link and haven't got 404
-        if pagination_links and not self.got_404:
+        # Only follow pagination if we found a valid next page link; there is
+        # no manually constructed URL any more, so a missing next link simply
+        # means the last page was reached
+        if pagination_links:
             self.logger.info(f"Found {len(pagination_links)} pagination link(s) on {response.url}")
-            # Only follow the first/next pagination link to avoid duplicates
+            # Only follow the first/next pagination link to avoid duplicates;
+            # links were already filtered against visited when collected
             for pagination_link in pagination_links:
-                if pagination_link not in self.visited_urls:
-                    self.visited_urls.add(pagination_link)
-                    yield response.follow(
-                        pagination_link,
-                        callback=self.parse,
-                        dont_filter=True,
-                        errback=self.handle_http_error
-                    )
-                    break  # Only follow one pagination link at a time
+                visited.add(pagination_link)
+                yield response.follow(
+                    pagination_link,
+                    callback=self.parse,
+                    errback=self.handle_http_error
+                )
+                break  # Only follow one pagination link at a time
         else:
-            if self.got_404:
-                self.logger.info(f"Stopped pagination due to 404 error")
-            else:
-                self.logger.info(f"No more pagination links found on {response.url}, reached end of pages")
+            self.logger.info(f"No more pagination links found on {response.url}, reached end of pages")
     
+    def _mark_scraped(self, url):
+        """Record a successfully parsed product so future runs skip it"""
+        try:
+            self._visited_db.execute(
+                'INSERT OR IGNORE INTO v(h) VALUES (?)', (_url_key(url),)
+            )
+            self._visited_db.commit()
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to record visited URL {url}: {e}")
+
+    def closed(self, reason):
+        """Close the persistent visited store when the crawl ends"""
+        self._visited_db.close()
+
     def handle_http_error(self, failure):
-        """Handle HTTP errors, especially 404"""
+        """Log HTTP errors on pagination requests"""
         if failure.value.response:
             status = failure.value.response.status
             url = failure.value.response.url
-            if status == 404:
-                self.got_404 = True
-                self.logger.warning(f"Got 404 error on {url}, stopping pagination")
-            else:
-                self.logger.error(f"HTTP error {status} on {url}")
+            self.logger.error(f"HTTP error {status} on {url}")
         else:
             self.logger.error(f"Request failed: {failure}")
     
@@ -268,10 +373,20 @@ class BullseyePressSpider(BaseComicSpider):
             description = 'Indian comic book publisher'
         item['description'] = clean_text(description)
         
-        item = self.add_scraped_timestamp(item)
-        item = self.clean_item(item)
+        item = self._finalize(item)
         return item
     
+    def _page_count_from(self, text):
+        """First in-range page count in an explicit "N pages"/"Pages: N" form"""
+        if not text:
+            return None
+        m = self._PAGE_COUNT_RE.search(text)
+        if m:
+            num = int(m.group(1) or m.group(2))
+            if MIN_PAGES <= num <= MAX_PAGES:
+                return num
+        return None
+
     def parse_product_detail(self, response):
         """
         Parse individual product/comic detail page.
@@ -286,9 +401,15 @@ class BullseyePressSpider(BaseComicSpider):
             if not title:
                 title = response.css('h1::text').get()
             item['title'] = clean_text(title)
-            
+
             # Extract publisher
             item['publisher'] = 'Bullseye Press'
+
+            # Single-shot selector reads used further below, batched here so
+            # the scattered sections don't each re-walk the tree
+            page_count_text = response.css('.page-count::text, [data-pages]::attr(data-pages), .pages::text, [data-page-count]::attr(data-page-count)').get()
+            isbn_raw = response.css('.sku::text, [data-isbn]::attr(data-isbn)').get()
+            categories = response.css('.product-categories a::text, .posted_in a::text').getall()
             
             # Extract price information
             # WooCommerce typically structures prices as:
@@ -297,107 +418,62 @@ class BullseyePressSpider(BaseComicSpider):
             #   <ins><span class="woocommerce-Price-amount">₹404</span></ins>  (discounted price)
             # </span>
             
-            # Strategy 1: Extract original price from <del> tag (strikethrough)
-            original_price = response.css('.price del .woocommerce-Price-amount::text, .price del .amount::text, .price del bdi::text, .original-price::text').get()
+            # Locate the .price subtree once and drill into it, instead of
+            # resolving every variant selector from the document root
+            price_sel = response.css('.price')
+
+            # Original price comes from the <del> (strikethrough) tag
+            original_price = price_sel.css('del .woocommerce-Price-amount::text, del .amount::text, del bdi::text').get()
+            if not original_price:
+                original_price = response.css('.original-price::text').get()
             if original_price:
                 original_price_value = extract_numbers(original_price)
                 if original_price_value:
                     item['original_price'] = original_price_value
-            
-            # Strategy 2: Extract discounted price from <ins> tag or regular price element
-            discounted_price = response.css('.price ins .woocommerce-Price-amount::text, .price ins .amount::text, .price ins bdi::text').get()
+
+            # Discounted price from the <ins> tag, else the regular price
+            # element (might be the only price — no-discount case)
+            discounted_price = price_sel.css('ins .woocommerce-Price-amount::text, ins .amount::text, ins bdi::text').get()
             if not discounted_price:
-                # If no <ins> tag, check regular price element (might be the only price)
-                discounted_price = response.css('.price .woocommerce-Price-amount::text, .price .amount::text, .current-price::text').get()
-            
+                discounted_price = price_sel.css('.woocommerce-Price-amount::text, .amount::text').get()
+            if not discounted_price:
+                discounted_price = response.css('.current-price::text').get()
+
             if discounted_price:
                 discounted_price_value = extract_numbers(discounted_price)
                 if discounted_price_value:
                     item['price'] = discounted_price_value
             
-            # Strategy 3: Fallback - if we didn't get both prices, try extracting all price elements
-            # Get all price amounts and determine which is original vs discounted
-            if not item.get('original_price') or not item.get('price'):
-                all_prices = response.css('.price .woocommerce-Price-amount::text, .price .amount::text, .price bdi::text').getall()
-                price_values = []
-                for price_text in all_prices:
-                    price_val = extract_numbers(price_text)
-                    if price_val and price_val not in price_values:
-                        price_values.append(price_val)
-                
-                if len(price_values) >= 2:
-                    # Higher price is usually the original, lower is discounted
-                    price_values.sort(reverse=True)
-                    if not item.get('original_price'):
-                        item['original_price'] = price_values[0]
-                    if not item.get('price'):
-                        item['price'] = price_values[1]
-                elif len(price_values) == 1:
-                    # Only one price found - it's the current price (no discount)
-                    if not item.get('price'):
-                        item['price'] = price_values[0]
-            
-            # Extract description (actual story/plot description)
-            # Check multiple locations where description might appear:
-            # 1. Short description area (above tabs)
-            # 2. Description tab panel (in WooCommerce tabs)
-            # 3. Description section after heading
-            description_text = []
-            
-            # Strategy 1: Check short description area (above tabs)
-            short_desc = response.css('.woocommerce-product-details__short-description p::text, .product-short-description p::text').getall()
-            if short_desc:
-                description_text.extend(short_desc)
-            
-            # Strategy 2: Check Description tab panel (WooCommerce tabs)
-            desc_tab = response.css('.woocommerce-Tabs-panel--description p::text, .woocommerce-tabs .description p::text').getall()
-            if desc_tab:
-                description_text.extend(desc_tab)
-            
-            # Strategy 3: Check for description after "Description" heading (more general approach)
-            # Look for content after h2 or h3 with "Description" text using XPath
-            desc_after_heading = response.xpath('//h2[contains(text(), "Description")]/following-sibling::*[1]//p/text() | //h3[contains(text(), "Description")]/following-sibling::*[1]//p/text()').getall()
-            if desc_after_heading:
-                description_text.extend(desc_after_heading)
-            
-            # Strategy 4: If no paragraph text found, try getting direct text (but exclude table content)
+            # Extract description (actual story/plot description) from the
+            # short-description area, the WooCommerce description tab and any
+            # "Description" heading, each queried exactly once
+            description_text = response.css(self._DESC_CSS).getall()
+            # Most pages carry the description in the short-desc/tab areas;
+            # only fall through to the heading XPath when they yield nothing
+            if not description_text:
+                description_text = response.xpath(self._DESC_XPATH).getall()
+
+            # If no paragraph text found, try getting direct text (but exclude table content)
             if not description_text:
-                # Get text from short description area
-                all_text = response.css('.woocommerce-product-details__short-description::text, .product-short-description::text').getall()
-                # Also check description tab
-                desc_tab_text = response.css('.woocommerce-Tabs-panel--description::text, .woocommerce-tabs .description::text').getall()
-                all_text.extend(desc_tab_text)
-                # Also try getting text after Description heading
-                desc_heading_text = response.xpath('//h2[contains(text(), "Description")]/following-sibling::*[1]//text() | //h3[contains(text(), "Description")]/following-sibling::*[1]//text()').getall()
-                all_text.extend(desc_heading_text)
+                all_text = response.css(self._DESC_FALLBACK_CSS).getall()
+                all_text += response.xpath(self._DESC_FALLBACK_XPATH).getall()
                 # Filter out text that's part of tables or additional info
                 description_text = [t for t in all_text if t.strip() and len(t.strip()) > 10]
             
-            # Filter out text that's clearly not description (like "Add to cart", "Wishlist", etc.)
-            filtered_description = []
-            skip_keywords = [
-                'add to cart', 'wishlist', 'share', 'category', 'reviews', 
-                'logged in customers', 'writer', 'art', 'pages', 'quantity',
-                'there are no reviews', 'only logged in'
+            # Keep only substantial story text: drop metadata chunks (_SKIP_RE)
+            # and short "Label: value" strings in one pass. clean_text already
+            # collapsed whitespace, so the space count equals word count - 1
+            filtered_description = [
+                tc for tc in (clean_text(t) for t in description_text)
+                if tc and len(tc) > 20 and not _SKIP_RE.search(tc)
+                and not (tc.count(' ') <= 2 and ':' in tc)
             ]
             
-            for text in description_text:
-                text_clean = clean_text(text)
-                if text_clean and len(text_clean) > 20:  # Only keep substantial text (story descriptions)
-                    text_lower = text_clean.lower()
-                    # Skip if it contains skip keywords or looks like metadata
-                    is_metadata = any(keyword in text_lower for keyword in skip_keywords)
-                    # Skip if it's too short or looks like a label
-                    is_label = len(text_clean.split()) <= 3 and ':' in text_clean
-                    
-                    if not is_metadata and not is_label:
-                        filtered_description.append(text_clean)
-            
             if filtered_description:
                 # Join and clean up the description
                 full_description = ' '.join(filtered_description)
                 # Remove any trailing metadata that might have slipped through
-                full_description = re.sub(r'\s*(Writer|Art|Pages|Category).*$', '', full_description, flags=re.IGNORECASE)
+                full_description = _TRAILING_META_RE.sub('', full_description)
                 item['description'] = clean_text(full_description)
             elif description_text:
                 # Fallback: use all text but clean it
@@ -411,27 +487,21 @@ class BullseyePressSpider(BaseComicSpider):
             additional_info_dict = {}
             
             if additional_info_section:
-                # Extract data from table rows
-                rows = additional_info_section.css('tr')
-                
+                # Extract data from table rows; string(.) concatenates nested
+                # cell text in lxml, so no per-cell ::text fallback is needed
+                rows = additional_info_section.xpath('.//tr')
+
                 for row in rows:
-                    # Get cells in the row
-                    cells = row.css('td, th')
+                    # First cell is the label, second cell is the value
+                    cells = row.xpath('./td|./th')
                     if len(cells) >= 2:
-                        # First cell is the label, second cell is the value
-                        label = cells[0].css('::text').get()
-                        value = cells[1].css('::text').get()
-                        
-                        # If direct text extraction didn't work, try getting all text from cells
-                        if not label:
-                            label = ' '.join(cells[0].css('*::text').getall())
-                        if not value:
-                            value = ' '.join(cells[1].css('*::text').getall())
-                        
+                        label = cells[0].xpath('string(.)').get()
+                        value = cells[1].xpath('string(.)').get()
+
                         if label and value:
-                            label_clean = clean_text(label).strip()
-                            value_clean = clean_text(value).strip()
-                            
+                            label_clean = clean_text(label)
+                            value_clean = clean_text(value)
+
                             if label_clean and value_clean:
                                 # Store in additional_info dict (use original case for label)
                                 additional_info_dict[label_clean] = value_clean
@@ -440,39 +510,27 @@ class BullseyePressSpider(BaseComicSpider):
                 if additional_info_dict:
                     item['additional_info'] = additional_info_dict
                 
-                # Also populate individual fields for backward compatibility
-                # Use case-insensitive matching to find keys
-                writer_text = None
-                art_text = None
-                colorist_text = None
-                
-                # Search through all keys case-insensitively
-                for key, value in additional_info_dict.items():
-                    key_lower = key.lower()
-                    
-                    # Match Writer
-                    if not writer_text and key_lower in ['writer', 'writers']:
-                        writer_text = value
-                    
-                    # Match Art/Artist/Artwork
-                    if not art_text and key_lower in ['art', 'artist', 'artwork', 'artists']:
-                        art_text = value
-                    
-                    # Match Colorist/Colors
-                    if not colorist_text and key_lower in ['colorist', 'colors', 'colourist', 'colours', 'colorists']:
-                        colorist_text = value
-                
+                # Also populate individual fields for backward compatibility.
+                # Case-fold the keys once, then look labels up directly
+                lower_map = {k.lower(): v for k, v in additional_info_dict.items()}
+                writer_text = lower_map.get('writer') or lower_map.get('writers')
+                art_text = (lower_map.get('art') or lower_map.get('artist')
+                            or lower_map.get('artwork') or lower_map.get('artists'))
+                colorist_text = (lower_map.get('colorist') or lower_map.get('colors')
+                                 or lower_map.get('colourist') or lower_map.get('colours')
+                                 or lower_map.get('colorists'))
+
                 # Extract Writer
                 if writer_text:
                     # Writer field might contain multiple writers, split by comma, &, or space
-                    writer_names = [w.strip() for w in re.split(r'[,&]', writer_text) if w.strip()]
+                    writer_names = [w.strip() for w in writer_text.replace('&', ',').split(',') if w.strip()]
                     if writer_names:
                         item['writers'] = normalize_list(writer_names)
                 
                 # Extract Art/Artist/Artwork
                 if art_text:
                     # Art field might contain multiple artists, split by comma, &, or space
-                    art_names = [a.strip() for a in re.split(r'[,&]', art_text) if a.strip()]
+                    art_names = [a.strip() for a in art_text.replace('&', ',').split(',') if a.strip()]
                     if art_names:
                         # Set artists from additional info (this takes precedence)
                         item['artists'] = normalize_list(art_names)
@@ -480,7 +538,7 @@ class BullseyePressSpider(BaseComicSpider):
                 # Extract Colorist/Colors
                 if colorist_text:
                     # Colorist field might contain multiple colorists, split by comma, &, or space
-                    colorist_names = [c.strip() for c in re.split(r'[,&]', colorist_text) if c.strip()]
+                    colorist_names = [c.strip() for c in colorist_text.replace('&', ',').split(',') if c.strip()]
                     if colorist_names:
                         item['colorists'] = normalize_list(colorist_names)
                 
@@ -507,7 +565,7 @@ class BullseyePressSpider(BaseComicSpider):
                 # Extract uploaded_date from cover_image_url
                 # Pattern: /wp-content/uploads/{year}/{month}/...
                 # Example: https://bullseyepress.in/wp-content/uploads/2024/10/WhatsApp-Image-2024-10-30-at-10.41.34-PM-1-600x897.jpeg
-                uploaded_date_match = re.search(r'/wp-content/uploads/(\d{4})/(\d{1,2})/', cover_image_url)
+                uploaded_date_match = _UPLOAD_DATE_RE.search(cover_image_url)
                 if uploaded_date_match:
                     year = int(uploaded_date_match.group(1))
                     month = int(uploaded_date_match.group(2))
@@ -515,287 +573,174 @@ class BullseyePressSpider(BaseComicSpider):
                     # Format as YYYY-MM-DD
                     item['listing_date'] = f"{year:04d}-{month:02d}-{day:02d}"
             
+            # Title and description are final from here on; read them once for
+            # the series/language/binding/page/artist blocks below
+            title_text = item.get('title') or ''
+            desc_text = item.get('description') or ''
+            # Lowercased once for the substring probes below, instead of
+            # per-strategy lower()/IGNORECASE passes
+            desc_lower = desc_text.lower()
+
             # Extract series information from title
             # Titles like "Raj Rahman 2", "Yagyaa Origins – Issue 5" contain series info
-            if item.get('title'):
-                series_match = re.search(r'^([^–\-0-9]+)', item['title'])
+            if title_text:
+                series_match = _SERIES_PREFIX_RE.search(title_text)
                 if series_match:
                     series_name = clean_text(series_match.group(1))
                     
                     # Clean up series name by removing common suffixes and metadata
-                    # First, remove language indicators (English, Hindi) from anywhere in the name
-                    series_name = re.sub(r'\s+English\s+', ' ', series_name, flags=re.IGNORECASE).strip()
-                    series_name = re.sub(r'\s+Hindi\s+', ' ', series_name, flags=re.IGNORECASE).strip()
-                    series_name = re.sub(r'\s+English\s*$', '', series_name, flags=re.IGNORECASE).strip()
-                    series_name = re.sub(r'\s+Hindi\s*$', '', series_name, flags=re.IGNORECASE).strip()
-                    
-                    # Then remove other suffixes like: Issue, Hardcover, Paperback, Variant Cover, etc.
-                    invalid_suffixes = [
-                        r'\s+Issue\s*$',  # "Issue" at the end
-                        r'\s+issue\s*$',  # "issue" at the end
-                        r'\s+Hardcover\s*$',  # "Hardcover" at the end
-                        r'\s+Paperback\s*$',  # "Paperback" at the end
-                        r'\s+Variant\s+Cover\s*$',  # "Variant Cover" at the end
-                        r'\s+Variant\s*$',  # "Variant" at the end
-                        r'\s+Regular\s+Cover\s*$',  # "Regular Cover" at the end
-                        r'\s+English\s+Hardcover\s*$',  # "English Hardcover" at the end
-                        r'\s+Hindi\s+Hardcover\s*$',  # "Hindi Hardcover" at the end
-                        r'\s+English\s+Paperback\s*$',  # "English Paperback" at the end
-                        r'\s+Hindi\s+Paperback\s*$',  # "Hindi Paperback" at the end
-                        r'\s+Combo\s+Issue\s*$',  # "Combo Issue" at the end
-                        r'\s+Combo\s*$',  # "Combo" at the end
-                    ]
-                    
-                    for suffix_pattern in invalid_suffixes:
-                        series_name = re.sub(suffix_pattern, '', series_name, flags=re.IGNORECASE).strip()
-                    
-                    # List of invalid series values to completely filter out
-                    invalid_series_values = [
-                        'Issue', 'issue', 'English', 'Hindi', 'Variant Cover', 'Variant',
-                        'Regular Cover', 'Issue 2', 'Issue 3', 'Issue 1-4', 'Combo of',
-                        'English Hardcover', 'Hindi Hardcover', 'English Paperback', 'Hindi Paperback'
-                    ]
-                    
+                    # First, remove language indicators (English, Hindi) from the middle
+                    series_name = _LANG_MID_RE.sub(' ', series_name).strip()
+
+                    # Then strip trailing suffixes (Issue, Hardcover, Variant
+                    # Cover, language markers, ...) until none remain
+                    while True:
+                        cleaned = _SERIES_CLEAN_RE.sub('', series_name).strip()
+                        if cleaned == series_name:
+                            break
+                        series_name = cleaned
+
                     # Check if the cleaned series name is valid
-                    if series_name and series_name not in invalid_series_values:
+                    if series_name and series_name not in _INVALID_SERIES:
                         # Additional check: if series name is too short or just numbers, skip it
                         if len(series_name) > 2 and not series_name.isdigit():
                             item['series'] = series_name
                         # If invalid, don't set series field (it won't appear in output)
                     
-                    # Extract issue number
-                    issue_match = re.search(r'Issue\s+(\d+)', item['title'], re.IGNORECASE)
-                    if issue_match:
+                    # Extract issue number with a plain character scan; titles
+                    # are short and this beats two regex searches. Prefer the
+                    # number following "Issue", else the first number in the
+                    # title (e.g. "Raj Rahman 2")
+                    digit_runs = ''.join(
+                        c if c.isdigit() else ' ' for c in title_text
+                    ).split()
+                    if digit_runs:
+                        number = digit_runs[0]
+                        issue_pos = title_text.lower().find('issue')
+                        if issue_pos != -1:
+                            tail = title_text[issue_pos + 5:]
+                            tail_runs = ''.join(
+                                c if c.isdigit() else ' ' for c in tail
+                            ).split()
+                            if tail_runs:
+                                number = tail_runs[0]
                         try:
-                            item['issue'] = int(issue_match.group(1))
+                            item['issue'] = int(number)
                         except ValueError:
                             pass
-                    else:
-                        # Try to extract number from title (e.g., "Raj Rahman 2")
-                        num_match = re.search(r'\b(\d+)\b', item['title'])
-                        if num_match:
-                            try:
-                                item['issue'] = int(num_match.group(1))
-                            except ValueError:
-                                pass
             
-            # Extract language from title and description
-            # Common languages: Hindi, English, and other possible variations
+            # Extract language from title and description in one scan (title
+            # comes first in the haystack, so it still wins when both match);
+            # the product meta/categories selector only runs as a last resort
             language = None
-            title_text = item.get('title', '')
-            desc_text = item.get('description', '')
-            
-            # Search in title first (more reliable)
-            language_match = re.search(r'\b(Hindi|English|हिंदी|Eng|Hin)\b', title_text, re.IGNORECASE)
+            language_match = self._LANG_RE.search(f'{title_text}\n{desc_text}')
+            if not language_match:
+                meta_text = response.css('.product_meta, .product-categories').get() or ''
+                language_match = self._LANG_RE.search(meta_text)
+
             if language_match:
                 lang = language_match.group(1)
                 # Normalize language names
-                if lang.lower() in ['hindi', 'hin', 'हिंदी']:
-                    language = 'Hindi'
-                elif lang.lower() in ['english', 'eng']:
-                    language = 'English'
-                else:
-                    language = lang.capitalize()
-            
-            # If not found in title, search in description
-            if not language:
-                language_match = re.search(r'\b(Hindi|English|हिंदी|Eng|Hin)\b', desc_text, re.IGNORECASE)
-                if language_match:
-                    lang = language_match.group(1)
-                    # Normalize language names
-                    if lang.lower() in ['hindi', 'hin', 'हिंदी']:
-                        language = 'Hindi'
-                    elif lang.lower() in ['english', 'eng']:
-                        language = 'English'
-                    else:
-                        language = lang.capitalize()
-            
-            # Also check for language in product meta or categories
-            if not language:
-                meta_text = response.css('.product_meta, .product-categories').get() or ''
-                language_match = re.search(r'\b(Hindi|English|हिंदी|Eng|Hin)\b', meta_text, re.IGNORECASE)
-                if language_match:
-                    lang = language_match.group(1)
-                    if lang.lower() in ['hindi', 'hin', 'हिंदी']:
-                        language = 'Hindi'
-                    elif lang.lower() in ['english', 'eng']:
-                        language = 'English'
-                    else:
-                        language = lang.capitalize()
-            
+                language = self._LANG_MAP.get(lang.lower()) or lang.capitalize()
+
             if language:
                 item['language'] = language
             
             # Extract binding information (Hardbound, Paperback, Hardcover, etc.)
             binding = None
-            title_text = item.get('title', '')
-            
+
             # Strategy 1: Extract from title (most common location)
-            # Look for binding keywords in title
-            binding_patterns = [
-                (r'\b(hardbound|hard\s*bound)\b', 'Hardbound'),
-                (r'\b(paperback|paper\s*back)\b', 'Paperback'),
-                (r'\b(hardcover|hard\s*cover)\b', 'Hardcover'),
-                (r'\b(softcover|soft\s*cover)\b', 'Softcover'),
-            ]
-            
-            for pattern, binding_value in binding_patterns:
-                if re.search(pattern, title_text, re.IGNORECASE):
-                    binding = binding_value
-                    break
+            # One alternation pass; the named group that hit tells the variant
+            binding_match = self._BINDING_RE.search(title_text)
+            if binding_match:
+                binding = self._BINDING_MAP[binding_match.lastgroup]
             
             # Strategy 2: Check additional_info section
             if not binding and item.get('additional_info'):
                 additional_info_dict = item.get('additional_info', {})
-                # Check all values in additional_info for binding keywords
-                for key, value in additional_info_dict.items():
-                    value_lower = str(value).lower()
-                    if 'hardbound' in value_lower or 'hard bound' in value_lower:
-                        binding = 'Hardbound'
-                        break
-                    elif 'paperback' in value_lower or 'paper back' in value_lower:
-                        binding = 'Paperback'
-                        break
-                    elif 'hardcover' in value_lower or 'hard cover' in value_lower:
-                        binding = 'Hardcover'
-                        break
-                    elif 'softcover' in value_lower or 'soft cover' in value_lower:
-                        binding = 'Softcover'
-                        break
-            
-            # Strategy 3: Check description as fallback
-            if not binding:
-                desc_text = item.get('description', '')
-                if desc_text:
-                    for pattern, binding_value in binding_patterns:
-                        if re.search(pattern, desc_text, re.IGNORECASE):
-                            binding = binding_value
-                            break
+                # One alternation pass over all values instead of eight
+                # substring checks per value
+                combined = ' '.join(str(v).lower() for v in additional_info_dict.values())
+                binding_match = self._BINDING_RE.search(combined)
+                if binding_match:
+                    binding = self._BINDING_MAP[binding_match.lastgroup]
+            
+            # Strategy 3: Check description as fallback. A plain substring
+            # probe is several times cheaper than the IGNORECASE regex, and
+            # most descriptions mention no binding at all, so only run the
+            # alternation when a probe hits
+            if not binding and desc_text:
+                if 'hard' in desc_lower or 'paper' in desc_lower or 'soft' in desc_lower:
+                    binding_match = self._BINDING_RE.search(desc_lower)
+                    if binding_match:
+                        binding = self._BINDING_MAP[binding_match.lastgroup]
             
             if binding:
                 item['binding'] = binding
             
-            # Extract variant information (e.g., "Regular Cover", "Action figure variant")
-            variant_match = re.search(r'(variant|cover|hardbound|paperback|hardcover)', item.get('title', ''), re.IGNORECASE)
-            
             # Extract page count from multiple sources
             page_count = None
             
-            # Try to extract from CSS selectors first (most reliable)
-            page_count_text = response.css('.page-count::text, [data-pages]::attr(data-pages), .pages::text, [data-page-count]::attr(data-page-count)').get()
+            # Try the dedicated page-count selectors first (most reliable);
+            # isdigit() avoids raising/catching on every non-numeric value
             if page_count_text:
-                try:
-                    page_count = int(clean_text(page_count_text))
-                except (ValueError, TypeError):
-                    pass
-            
-            # If not found, try to extract from description
+                cleaned_count = clean_text(page_count_text)
+                if cleaned_count and cleaned_count.isdigit():
+                    page_count = int(cleaned_count)
+            
+            # If not found, try the explicit "64 pages"/"Pages: 64" forms over
+            # description, then product meta, then the raw page body — each
+            # source scanned at most once, later (costlier) sources only when
+            # the earlier ones miss
             if not page_count:
-                desc_text = item.get('description', '')
-                if desc_text:
-                    # Pattern 1: Look for explicit "64 pages", "64 pgs", "64 p." patterns
-                    page_match = re.search(r'\b(\d+)\s*(?:pages?|pgs?|p\.?)\b', desc_text, re.IGNORECASE)
-                    if page_match:
-                        try:
-                            num = int(page_match.group(1))
-                            # Validate page count using constants
-                            if MIN_PAGES <= num <= MAX_PAGES:
-                                page_count = num
-                        except (ValueError, TypeError):
-                            pass
-                    
-                    # Pattern 2: Look for standalone numbers at the end (common pattern: "Name Name Name 64")
-                    if not page_count:
-                        # Split description and check the last few words
-                        words = desc_text.strip().split()
-                        # Check last 3 words for a number that could be page count
-                        for word in reversed(words[-3:]):
-                            # Remove any trailing punctuation
-                            clean_word = word.strip('.,;:!?')
-                            if clean_word.isdigit():
-                                num = int(clean_word)
-                                # Validate page count using constants
-                                if MIN_PAGES <= num <= MAX_PAGES:
-                                    page_count = num
-                                    break
-                    
-                    # Pattern 3: Look for any number in description (fallback)
-                    if not page_count:
-                        numbers = re.findall(r'\b(\d+)\b', desc_text)
-                        if numbers:
-                            # Prefer numbers that appear after names (likely page count)
-                            for num_str in reversed(numbers):  # Check from end first
-                                num = int(num_str)
-                                # Validate page count using constants
-                                if MIN_PAGES <= num <= MAX_PAGES:
-                                    page_count = num
-                                    break
-            
-            # Also check product meta and additional info sections
+                page_count = self._page_count_from(desc_text)
             if not page_count:
-                meta_text = response.css('.product_meta, .woocommerce-Tabs-panel--additional_information').get() or ''
-                if meta_text:
-                    # Look for explicit page mentions
-                    page_match = re.search(r'\b(\d+)\s*(?:pages?|pgs?|p\.?)\b', meta_text, re.IGNORECASE)
-                    if page_match:
-                        try:
-                            num = int(page_match.group(1))
-                            # Validate page count using constants
-                            if MIN_PAGES <= num <= MAX_PAGES:
-                                page_count = num
-                        except (ValueError, TypeError):
-                            pass
-            
-            # Also check the full response text for page information
+                # additional_info_section already holds this subtree selection
+                page_count = self._page_count_from(additional_info_section.get())
             if not page_count:
-                full_text = response.text
-                # Look for patterns like "Pages: 64", "64 pages", etc.
-                page_match = re.search(r'(?:pages?|pgs?)[:\s]+(\d+)\b', full_text, re.IGNORECASE)
-                if page_match:
-                    try:
-                        num = int(page_match.group(1))
-                        # Validate page count using constants
+                # Prefer the product container (a few KB) over the entire HTML
+                # body; only when that slice also misses scan the full response
+                page_count = self._page_count_from(response.css('.product, .entry-content').get())
+            if not page_count:
+                page_count = self._page_count_from(response.text)
+
+            # Last resort: bare numbers in the description
+            if not page_count and desc_text:
+                # Standalone number at the end (common pattern: "Name Name Name 64")
+                trailing = _TRAILING_NUM_RE.search(desc_text)
+                if trailing:
+                    num = int(trailing.group(1))
+                    # Validate page count using constants
+                    if MIN_PAGES <= num <= MAX_PAGES:
+                        page_count = num
+                # Any number in the description, scanned from the end
+                if not page_count:
+                    for num_str in reversed(_NUM_SCAN_RE.findall(desc_text)):
+                        num = int(num_str)
                         if MIN_PAGES <= num <= MAX_PAGES:
                             page_count = num
-                    except (ValueError, TypeError):
-                        pass
-            
+                            break
+
             if page_count:
                 item['pages'] = page_count
             
-            # Extract additional product details from WooCommerce tabs
-            # Check for additional information tabs
-            additional_info = response.css('.woocommerce-Tabs-panel--additional_information, .product_meta').get()
-            
             # Extract SKU, ISBN if available
-            isbn = response.css('.sku::text, [data-isbn]::attr(data-isbn)').get()
-            if isbn:
-                item['isbn'] = clean_text(isbn)
+            if isbn_raw:
+                item['isbn'] = clean_text(isbn_raw)
             
             # Extract artist information from product data
             # Note: Artists from additional_info are already extracted above and take precedence
             artists = []
-            
-            # Invalid keywords to filter out (cache, UI elements, etc.)
-            invalid_keywords = [
-                'litespeed', 'cache', 'comments', 'feed', 'quantity', 
-                'logged', 'customers', 'purchased', 'product', 'review',
-                'there', 'are', 'no', 'reviews', 'yet', 'only', 'may', 'leave',
-                'hand', 'painted', 'variant', 'cover', 'wraparound', 'poster',
-                'homage', 'action', 'figure', 'regular', 'hardbound', 'paperback',
-                'hardcover', 'english', 'hindi', 'issue', 'shot', 'one'
-            ]
-            
+
             # Strategy 1: Extract from title if it mentions "by [Artist]"
-            title_text = item.get('title', '')
             if title_text:
                 # Pattern: "Title by Artist Name" or "Title variant by Artist"
                 # Handle patterns like "Title - variant by Artist Name" or "Title by Artist Name"
-                by_match = re.search(r'\bby\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)', title_text, re.IGNORECASE)
+                by_match = self._BY_TITLE_RE.search(title_text)
                 if by_match:
                     artist_name = clean_text(by_match.group(1))
                     artist_lower = artist_name.lower()
-                    is_invalid = any(keyword in artist_lower for keyword in invalid_keywords)
+                    is_invalid = self._INVALID_RE.search(artist_lower) is not None
                     if artist_name and len(artist_name) > 2 and not is_invalid:
                         artists.append(artist_name)
             
@@ -803,13 +748,13 @@ class BullseyePressSpider(BaseComicSpider):
             # Example: "raj-rahman-2-english-regular-cover-by-deepjoy-subba"
             if not artists:
                 url_slug = response.url.split('/')[-2] if response.url.endswith('/') else response.url.split('/')[-1]
-                by_in_url = re.search(r'-by-([a-z]+(?:-[a-z]+)+)', url_slug, re.IGNORECASE)
+                by_in_url = self._BY_URL_RE.search(url_slug)
                 if by_in_url:
                     # Convert "deepjoy-subba" to "Deepjoy Subba"
                     artist_slug = by_in_url.group(1)
                     artist_name = ' '.join(word.capitalize() for word in artist_slug.split('-'))
                     artist_lower = artist_name.lower()
-                    is_invalid = any(keyword in artist_lower for keyword in invalid_keywords)
+                    is_invalid = self._INVALID_RE.search(artist_lower) is not None
                     if artist_name and len(artist_name) > 2 and not is_invalid:
                         artists.append(artist_name)
             
@@ -817,25 +762,20 @@ class BullseyePressSpider(BaseComicSpider):
             # This is less reliable as descriptions often contain character names, not artist names
             # Only use this as a last resort if artists weren't found in additional_info or title
             if not item.get('artists') and not artists:
-                desc_text = item.get('description', '')
                 if desc_text:
-                    # Remove common review text that appears at the end
-                    desc_text = re.sub(r'There are no reviews yet.*', '', desc_text, flags=re.IGNORECASE)
-                    desc_text = re.sub(r'Only logged in customers.*', '', desc_text, flags=re.IGNORECASE)
-                    
+                    # Remove common review text that appears at the end; a
+                    # distinct local so the stripping doesn't leak into the
+                    # later uses of desc_text
+                    desc_for_artist = self._REVIEW_STRIP_RE.sub('', desc_text)
+
                     # Look for explicit artist mentions in description
                     # Pattern: "by Artist Name" or "Artist: Name" or "Art by Name"
-                    explicit_artist_patterns = [
-                        r'\b(?:by|artist|art by|artwork by|illustrated by|drawn by)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
-                        r'(?:artist|artwork|illustrator)[:\s]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
-                    ]
-                    
-                    for pattern in explicit_artist_patterns:
-                        artist_match = re.search(pattern, desc_text, re.IGNORECASE)
+                    for pattern in _DESC_ARTIST_RES:
+                        artist_match = pattern.search(desc_for_artist)
                         if artist_match:
                             artist_name = clean_text(artist_match.group(1))
                             artist_lower = artist_name.lower()
-                            is_invalid = any(keyword in artist_lower for keyword in invalid_keywords)
+                            is_invalid = self._INVALID_RE.search(artist_lower) is not None
                             if artist_name and len(artist_name) > 2 and not is_invalid:
                                 artists.append(artist_name)
                                 break
@@ -843,32 +783,25 @@ class BullseyePressSpider(BaseComicSpider):
                     # Only extract from description text if we found explicit mentions
                     # Don't extract random capitalized words as they're likely character names
             
-            # Strategy 3: Extract from product meta fields (WooCommerce specific)
-            product_meta = response.css('.product_meta, .woocommerce-product-details__short-description').get() or ''
-            if product_meta:
-                # Look for explicit meta labels only (avoid generic capitalized names)
+            # Strategy 3: Extract from product meta fields (WooCommerce specific);
+            # skipped once an earlier strategy already found someone
+            if not artists:
+                # Look for explicit meta labels only (avoid generic capitalized
+                # names); the text read doubles as the presence check
                 meta_text = ' '.join(response.css('.product_meta *::text, .woocommerce-product-details__short-description *::text').getall())
                 if meta_text:
-                    explicit_meta_patterns = [
-                        r'\b(?:artist|art|art by|artwork by|illustrated by|drawn by)[:\s]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
-                    ]
-                    for pattern in explicit_meta_patterns:
-                        m = re.search(pattern, meta_text, re.IGNORECASE)
-                        if m:
-                            name = clean_text(m.group(1))
-                            name_lower = name.lower()
-                            is_invalid = any(keyword in name_lower for keyword in invalid_keywords)
-                            if not is_invalid and len(name) > 3 and name not in artists:
-                                artists.append(name)
+                    m = _META_ARTIST_RE.search(meta_text)
+                    if m:
+                        name = clean_text(m.group(1))
+                        name_lower = name.lower()
+                        is_invalid = self._INVALID_RE.search(name_lower) is not None
+                        if not is_invalid and len(name) > 3 and name not in artists:
+                            artists.append(name)
             
             # Strategy 4: Extract cover artist from title if mentioned
-            if title_text:
-                cover_patterns = [
-                    r'cover\s+(?:by|artist)[:\s]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-                    r'variant\s+by\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-                ]
-                for pattern in cover_patterns:
-                    cover_match = re.search(pattern, title_text, re.IGNORECASE)
+            if not artists and title_text:
+                for pattern in _COVER_ARTIST_RES:
+                    cover_match = pattern.search(title_text)
                     if cover_match:
                         cover_artist = clean_text(cover_match.group(1))
                         if cover_artist and len(cover_artist) > 2:
@@ -880,32 +813,22 @@ class BullseyePressSpider(BaseComicSpider):
             # Clean and deduplicate artists
             # Only set artists from description if they weren't already set from additional_info
             if artists and not item.get('artists'):
-                # Remove duplicates while preserving order and filter invalid entries
-                seen = set()
-                unique_artists = []
-                for artist in artists:
-                    artist_clean = clean_text(artist)
-                    artist_lower = artist_clean.lower()
-                    
-                    # Final validation: check length, duplicates, and invalid keywords
-                    is_invalid = any(keyword in artist_lower for keyword in invalid_keywords)
-                    
-                    if (artist_lower not in seen and 
-                        len(artist_clean) > 2 and 
-                        not is_invalid and
-                        artist_clean.strip()):
-                        seen.add(artist_lower)
-                        unique_artists.append(artist_clean)
-                
+                # dict.fromkeys keeps insertion order (CPython 3.7+), replacing
+                # the manual seen-set loop; candidates were validated upstream
+                # so this is just the final clean + length/keyword gate
+                unique_artists = list(dict.fromkeys(
+                    a for a in (clean_text(artist) for artist in artists)
+                    if a and len(a) > 2 and not self._INVALID_RE.search(a.lower())
+                ))
                 if unique_artists:
                     item['artists'] = normalize_list(unique_artists)
             
-            # Extract genre (could be manga, comic, etc.)
-            # Check product categories
-            categories = response.css('.product-categories a::text, .posted_in a::text').getall()
+            # Extract genre (could be manga, comic, etc.) from the product
+            # categories read at the top
             if categories:
-                # Filter out "Uncategorized" and empty values
-                genres = [clean_text(cat) for cat in categories if cat and clean_text(cat).lower() != 'uncategorized']
+                # Filter out "Uncategorized" and empty values; the walrus
+                # keeps clean_text to one call per category
+                genres = [c for cat in categories if cat and (c := clean_text(cat)) and c.lower() != 'uncategorized']
                 # Only set genre if we have valid genres (not empty)
                 if genres:
                     item['genre'] = normalize_list(genres)
@@ -919,8 +842,7 @@ class BullseyePressSpider(BaseComicSpider):
             # Store URL
             item['url'] = response.url
             
-            item = self.add_scraped_timestamp(item)
-            item = self.clean_item(item)
+            item = self._finalize(item)
         
         except Exception as e:
             self.logger.error(f"Error parsing product detail for {response.url}: {e}", exc_info=True)
@@ -940,6 +862,7 @@ class BullseyePressSpider(BaseComicSpider):
         if item and item.get('title'):
             try:
                 yield item
+                self._mark_scraped(response.url)
             except Exception as e:
                 self.logger.error(f"Error yielding item for {response.url}: {e}", exc_info=True)
         else:
@@ -952,8 +875,7 @@ class BullseyePressSpider(BaseComicSpider):
                 series_item['title'] = item['series']
                 series_item['publisher'] = 'Bullseye Press'
                 series_item['url'] = response.url
-                series_item = self.add_scraped_timestamp(series_item)
-                series_item = self.clean_item(series_item)
+                series_item = self._finalize(series_item)
                 yield series_item
             except Exception as e:
                 self.logger.error(f"Error creating SeriesItem for {response.url}: {e}", exc_info=True)
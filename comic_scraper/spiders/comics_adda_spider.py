@@ -7,8 +7,111 @@ from comic_scraper.spiders.base_spider import BaseComicSpider
 from comic_scraper.items import PublisherItem, ComicItem, SeriesItem, ArtistItem
 from comic_scraper.utils.helpers import clean_text, normalize_list, extract_numbers, parse_date
 from comic_scraper.constants import MIN_PAGES, MAX_PAGES
+from urllib.parse import parse_qs, urlsplit
 import re
 
+try:
+    from pybloom_live import ScalableBloomFilter
+    BLOOM_AVAILABLE = True
+except ImportError:
+    BLOOM_AVAILABLE = False
+
+
+# Compiled once at import: these run on every listing page and every product
+# page, so don't rely on re's bounded pattern cache
+_PAGE_URL_RE = re.compile(r'[?&]page=(\d+)')
+_PUBLISHED_BY_RE = re.compile(r'published\s+by\s+([^\.\n]+)', re.IGNORECASE)
+_PRODUCED_BY_RE = re.compile(r'produced\s+by\s+([^\.\n]+)', re.IGNORECASE)
+# Series name stops at Issue, Vol./Volume, Stage, colon, dash, hash or a
+# pre-booking marker; the fallback takes everything up to the first separator
+_SERIES_RE = re.compile(
+    r'^(.+?)(?:\s+Issue\s+\d+|\s+Vol\.|\s+Vol\s+\d+|\s+Volume\s+\d+|\s+Volume\s+'
+    r'|\s+Stage\s+\d+|[:–\-#]|\(Pre Booking\)|\(Prebooking\))',
+    re.IGNORECASE,
+)
+_SERIES_FALLBACK_RE = re.compile(r'^([^:–\-#(]+)')
+# Mid-string language markers are collapsed to a space; every trailing
+# suffix lives in one alternation applied to a fixed point so stacked
+# suffixes ("Hindi Issue 3 Paperback") all go in a couple of passes
+_MID_LANG_RE = re.compile(r'\s+(?:English|Hindi)\s+', re.IGNORECASE)
+_SERIES_CLEAN_RE = re.compile(
+    r'\s+(?:English|Hindi|Issue(?:\s+\d+)?|Vol\.?\s+\d+|Volume\s+\d+'
+    r'|Stage\s+\d+|Hardcover|Paperback|Variant|Regular\s+Cover'
+    r'|Pre\s+Booking|Prebooking)\s*$',
+    re.IGNORECASE,
+)
+_ISSUE_RE = re.compile(r'Issue[-\s]*(\d+)', re.IGNORECASE)
+_VOL_RE = re.compile(r'Vol\.?\s*(\d+)', re.IGNORECASE)
+# Language keywords in priority order, probed against the lowercased
+# title+description haystack
+_LANG_KEYWORDS = (
+    ('hindi', 'Hindi'),
+    ('english', 'English'),
+    ('malayalam', 'Malayalam'),
+    ('bangla', 'Bengali'),
+    ('bengali', 'Bengali'),
+)
+# One alternation over all binding variants, run against the pre-lowered
+# haystack; the named group that matched picks the value via _BINDING_MAP
+_BINDING_RE = re.compile(
+    r'\b(?:(?P<hardbound>hardbound|hard\s*bound|hb)'
+    r'|(?P<paperback>paperback|paper\s*back|pb)'
+    r'|(?P<hardcover>hardcover|hard\s*cover|hc)'
+    r'|(?P<softcover>softcover|soft\s*cover)'
+    r'|(?P<deluxe>deluxe\s*edition))\b'
+)
+_BINDING_MAP = {
+    'hardbound': 'Hardbound',
+    'paperback': 'Paperback',
+    'hardcover': 'Hardcover',
+    'softcover': 'Softcover',
+    'deluxe': 'Deluxe Edition',
+}
+# Every explicit page-count spelling the site uses; shared by the description,
+# title and raw-HTML strategies
+_PAGES_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'pages?[:\s]+(\d+)',  # "Pages: 48" or "Pages 48"
+    r'(\d+)\s*pages?',  # "48 Pages" or "48 pages"
+    r'page\s+count[:\s]+(\d+)',  # "Page Count: 48"
+    r'no\s+of\s+pages?[:\s]+(\d+)',  # "No of Pages: 48"
+    r'number\s+of\s+pages?[:\s]+(\d+)',  # "Number of Pages: 48"
+))
+_PAGES_TITLE_RE = re.compile(r'(\d+)\s*pages?', re.IGNORECASE)
+# OpenCart image URL rewriting (cache path and -WxH size suffix)
+_IMG_SIZE_RE = re.compile(r'-\d+x\d+\.(jpg|jpeg|png|webp)', re.IGNORECASE)
+_IMG_CACHE_RE = re.compile(r'/image/cache/catalog/', re.IGNORECASE)
+_DATE_RES = (
+    re.compile(r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})'),  # DD-MM-YYYY or DD/MM/YYYY
+    re.compile(r'(\d{4}[-/]\d{1,2}[-/]\d{1,2})'),  # YYYY-MM-DD or YYYY/MM/DD
+)
+# O(1) membership tables for the hot-path validity checks (frozensets
+# instead of per-call list scans)
+_INVALID_BRANDS = frozenset({'comicsadda', 'comics adda', 'n/a', 'none', ''})
+# Seller-side values that are not real publishers
+_INVALID_PUBLISHERS = frozenset({
+    'brands', 'individual', 'comicsadda', 'comics adda', 'n/a', 'none', '',
+})
+# Cleaned series names that are really just leftover format/language noise
+_INVALID_SERIES = frozenset({
+    'Issue', 'issue', 'English', 'Hindi', 'Variant', 'Pre Booking', 'Prebooking',
+})
+# Brand/manufacturer locations, most reliable first; a tuple so the list
+# isn't rebuilt on every product page
+_BRAND_SELECTORS = (
+    'a[href*="manufacturer"]::text',  # Brand link with manufacturer in href
+    'a[href*="brand"]::text',  # Brand link alternative
+    '.manufacturer a::text',  # Manufacturer link
+    '.brand a::text',  # Brand link
+    'span:contains("Brand") + a::text',  # Brand label followed by link
+    'span:contains("Manufacturer") + a::text',  # Manufacturer label followed by link
+    'td:contains("Brand") + td a::text',  # Brand in table with link
+    'td:contains("Manufacturer") + td a::text',  # Manufacturer in table with link
+    '.manufacturer::text',  # Direct text (fallback)
+    '.brand::text',  # Direct text (fallback)
+    '[itemprop="brand"]::text',  # Schema.org brand
+    '.product-brand::text',  # Product brand class
+)
+
 
 class ComicsAddaSpider(BaseComicSpider):
     """
@@ -24,15 +127,35 @@ class ComicsAddaSpider(BaseComicSpider):
     start_urls = ['https://comicsadda.com/']
     
     custom_settings = {
-        'DOWNLOAD_DELAY': 2,
-        'RANDOMIZE_DOWNLOAD_DELAY': 0.5,
-        'CONCURRENT_REQUESTS_PER_DOMAIN': 2,
+        # The crawl is network-bound; with 2 concurrent requests and a 2s
+        # delay it was capped around 0.5 req/s. Raise concurrency and let
+        # AutoThrottle adapt the delay to observed latency instead
+        'CONCURRENT_REQUESTS': 32,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 16,
+        'DOWNLOAD_DELAY': 0.25,
+        'AUTOTHROTTLE_ENABLED': True,
+        'AUTOTHROTTLE_START_DELAY': 0.5,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 8.0,
+        # Keep resolved hostnames cached for the crawl's lifetime and give
+        # the reactor threadpool (which serves DNS lookups) headroom for
+        # the raised concurrency; connections themselves are already kept
+        # alive by Scrapy's HTTP/1.1 pool
+        'DNSCACHE_ENABLED': True,
+        'REACTOR_THREADPOOL_MAXSIZE': 20,
         'ROBOTSTXT_OBEY': False,  # Some sites don't have proper robots.txt
     }
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.visited_urls = set()
+        # Bloom filter keeps dedup memory at a few bits per URL instead of
+        # ~200 bytes for a set entry; the scalable variant grows as the
+        # crawl does. Falls back to a set when pybloom-live isn't installed
+        if BLOOM_AVAILABLE:
+            self.visited_urls = ScalableBloomFilter(
+                initial_capacity=100_000, error_rate=1e-6
+            )
+        else:
+            self.visited_urls = set()
         self.publisher_yielded = False
         self.got_404 = False  # Flag to track if we got a 404 error
     
@@ -51,37 +174,29 @@ class ComicsAddaSpider(BaseComicSpider):
         if not self.publisher_yielded:
             yield self.extract_publisher_info(response)
             self.publisher_yielded = True
+
+        # Current page number, parsed once from the URL query instead of
+        # re-running the page regex at each pagination strategy
+        page_vals = parse_qs(urlsplit(response.url).query).get('page')
+        current_page = int(page_vals[0]) if page_vals and page_vals[0].isdigit() else 1
         
-        # Multiple strategies to find product links
+        # One full href sweep finds every product link; the URL substring
+        # filter below is what actually decides, so the seven OpenCart
+        # layout-specific selector queries were redundant tree walks on top
+        # of this same scan
+        # The substring test runs on the raw href before urljoin, and each
+        # distinct href is joined only once — urljoin builds a SplitResult
+        # per call, and product links repeat (image + title anchors)
         product_links = set()
-        
-        # Strategy 1: Find all product links using OpenCart selectors
-        product_selectors = [
-            '.product-layout a::attr(href)',
-            '.product-grid a::attr(href)',
-            '.product-item a::attr(href)',
-            '.product-thumb a::attr(href)',
-            'a[href*="/product/"]::attr(href)',
-            'a[href*="route=product/product"]::attr(href)',
-            '.product-list a::attr(href)',
-        ]
-        
-        for selector in product_selectors:
-            links = response.css(selector).getall()
-            for link in links:
-                if link and ('/product/' in link or 'route=product/product' in link):
+        seen_hrefs = set()
+        for link in response.css('a::attr(href)').getall():
+            if link and link not in seen_hrefs:
+                seen_hrefs.add(link)
+                if '/product/' in link or 'route=product/product' in link:
                     full_url = response.urljoin(link)
                     if full_url not in self.visited_urls:
                         product_links.add(full_url)
         
-        # Strategy 2: Find all links that contain product in the URL
-        all_links = response.css('a::attr(href)').getall()
-        for link in all_links:
-            if link and ('/product/' in link or 'route=product/product' in link):
-                full_url = response.urljoin(link)
-                if full_url not in self.visited_urls and full_url not in product_links:
-                    product_links.add(full_url)
-        
         self.logger.info(f"Found {len(product_links)} product links on {response.url}")
         
         # Follow all product links
@@ -101,69 +216,46 @@ class ComicsAddaSpider(BaseComicSpider):
         # Handle pagination - OpenCart typically uses ?page=X or route=product/category&page=X
         pagination_links = set()
         
-        # Strategy 1: Next page link
-        next_selectors = [
-            'a[rel="next"]::attr(href)',
-            '.pagination .next::attr(href)',
-            '.pagination a:contains("Next")::attr(href)',
-            '.pagination a:contains(">")::attr(href)',
-        ]
-        for selector in next_selectors:
-            next_link = response.css(selector).get()
-            if next_link:
-                full_url = response.urljoin(next_link)
-                if full_url and full_url not in self.visited_urls and full_url != response.url:
-                    pagination_links.add(full_url)
-                    break
+        # Strategy 1: Next page link - one comma-joined query over every
+        # known next-link location instead of four separate tree walks
+        next_link = response.css(
+            'a[rel="next"]::attr(href), .pagination .next::attr(href), '
+            '.pagination a:contains("Next")::attr(href), '
+            '.pagination a:contains(">")::attr(href)'
+        ).get()
+        if next_link:
+            full_url = response.urljoin(next_link)
+            if full_url and full_url not in self.visited_urls and full_url != response.url:
+                pagination_links.add(full_url)
         
         # Strategy 2: Get page number links
         if not pagination_links:
-            # Extract current page number
-            current_page = 1
-            page_match = re.search(r'[?&]page=(\d+)', response.url)
-            if page_match:
-                current_page = int(page_match.group(1))
-            
-            # Get all page number links
-            page_number_selectors = [
-                '.pagination a::attr(href)',
-                '.pagination li a::attr(href)',
-            ]
-            for selector in page_number_selectors:
-                links = response.css(selector).getall()
-                for link in links:
-                    if not link:
-                        continue
-                    full_url = response.urljoin(link)
-                    if full_url == response.url or full_url in self.visited_urls:
-                        continue
-                    
-                    # Extract page number from the link
-                    link_page_match = re.search(r'[?&]page=(\d+)', full_url)
-                    if link_page_match:
-                        link_page = int(link_page_match.group(1))
-                        # Only follow if it's the next page or a future page
-                        if link_page > current_page:
-                            pagination_links.add(full_url)
-                            break
+            # Get all page number links; .pagination a already covers the
+            # .pagination li a variant
+            for link in response.css('.pagination a::attr(href)').getall():
+                if not link:
+                    continue
+                full_url = response.urljoin(link)
+                if full_url == response.url or full_url in self.visited_urls:
+                    continue
+
+                # Extract page number from the link
+                link_page_match = _PAGE_URL_RE.search(full_url)
+                if link_page_match:
+                    link_page = int(link_page_match.group(1))
+                    # Only follow if it's the next page or a future page
+                    if link_page > current_page:
+                        pagination_links.add(full_url)
+                        break
         
-        # Strategy 3: Construct next page URL manually
-        if not pagination_links:
-            current_page = 1
+        # Strategy 3: Construct next page URL manually. Only when this page
+        # itself used the ?page= pattern and still listed products —
+        # guessing blindly cost one guaranteed-404 fetch at the end of
+        # every category
+        if not pagination_links and product_links and 'page=' in response.url:
             base_url = response.url.split('?')[0]
-            
-            # Check if URL contains page number
-            page_match = re.search(r'[?&]page=(\d+)', response.url)
-            if page_match:
-                current_page = int(page_match.group(1))
-            
-            # Construct next page URL
-            next_page = current_page + 1
-            if '?' in response.url:
-                next_page_url = f"{base_url}?page={next_page}"
-            else:
-                next_page_url = f"{base_url}?page={next_page}"
-            
+            next_page_url = f"{base_url}?page={current_page + 1}"
+
             if next_page_url not in self.visited_urls and next_page_url != response.url:
                 pagination_links.add(next_page_url)
                 self.logger.info(f"Constructed next page URL: {next_page_url}")
@@ -231,39 +323,37 @@ class ComicsAddaSpider(BaseComicSpider):
             if not title:
                 title = response.css('h1.product-title::text').get()
             item['title'] = clean_text(title)
-            
+
+            # All description text in one tree walk, reused by the publisher,
+            # description and page-count strategies below
+            desc_parts = response.css(
+                '.product-description::text, .description::text, '
+                '#tab-description::text, .tab-content .description::text'
+            ).getall()
+            desc_blob = ' '.join(desc_parts)
+
+            # Attribute/spec table rows, selected once and shared by the
+            # publisher scan and the additional-info harvest below
+            attribute_rows = response.css(
+                '.attribute tr, .product-attributes tr, .product-info tr'
+            )
+
             # Extract publisher - ComicsAdda is a seller/retailer, Brand field contains the actual publisher
             publisher = None
             
             # Strategy 1: Extract from Brand/Manufacturer field (most reliable in OpenCart)
             # OpenCart typically displays brand as: <span>Brand:</span> <a href="...">Brand Name</a>
-            brand_selectors = [
-                'a[href*="manufacturer"]::text',  # Brand link with manufacturer in href
-                'a[href*="brand"]::text',  # Brand link alternative
-                '.manufacturer a::text',  # Manufacturer link
-                '.brand a::text',  # Brand link
-                'span:contains("Brand") + a::text',  # Brand label followed by link
-                'span:contains("Manufacturer") + a::text',  # Manufacturer label followed by link
-                'td:contains("Brand") + td a::text',  # Brand in table with link
-                'td:contains("Manufacturer") + td a::text',  # Manufacturer in table with link
-                '.manufacturer::text',  # Direct text (fallback)
-                '.brand::text',  # Direct text (fallback)
-                '[itemprop="brand"]::text',  # Schema.org brand
-                '.product-brand::text',  # Product brand class
-            ]
-            
-            for selector in brand_selectors:
+            for selector in _BRAND_SELECTORS:
                 brand_text = response.css(selector).get()
                 if brand_text:
                     brand_text = clean_text(brand_text)
-                    if brand_text and brand_text.lower() not in ['comicsadda', 'comics adda', 'n/a', 'none', '']:
+                    if brand_text and brand_text.lower() not in _INVALID_BRANDS:
                         publisher = brand_text
                         break
             
             # Strategy 2: Extract from product attributes table (Brand/Manufacturer column)
             if not publisher:
                 # Look for Brand or Manufacturer in attribute tables
-                attribute_rows = response.css('.attribute tr, .product-attributes tr, table.attribute tr, .product-info tr')
                 for row in attribute_rows:
                     # Get all text from the row
                     row_text = ' '.join(row.css('::text').getall()).lower()
@@ -277,7 +367,7 @@ class ComicsAddaSpider(BaseComicSpider):
                         key_lower = key.lower()
                         # Check if this row is about brand/manufacturer
                         if ('brand' in key_lower or 'manufacturer' in key_lower or 'publisher' in key_lower):
-                            if value.lower() not in ['comicsadda', 'comics adda', 'n/a', 'none', '']:
+                            if value.lower() not in _INVALID_BRANDS:
                                 publisher = value
                                 break
                     
@@ -287,29 +377,25 @@ class ComicsAddaSpider(BaseComicSpider):
                         value_cells = row.css('td:last-child a::text, td:last-child::text, td:nth-child(2) a::text, td:nth-child(2)::text').getall()
                         for val in value_cells:
                             val_clean = clean_text(val)
-                            if val_clean and val_clean.lower() not in ['comicsadda', 'comics adda', 'n/a', 'none', '']:
+                            if val_clean and val_clean.lower() not in _INVALID_BRANDS:
                                 publisher = val_clean
                                 break
                         if publisher:
                             break
             
             # Strategy 3: Extract from product description (look for PUBLISHED/PRODUCED BY patterns)
-            if not publisher:
-                desc_text = ' '.join(response.css('.product-description::text, .description::text, #tab-description::text').getall())
-                if desc_text:
-                    # Look for "PUBLISHED BY" or "PRODUCED BY" patterns
-                    published_match = re.search(r'published\s+by\s+([^\.\n]+)', desc_text, re.IGNORECASE)
-                    if published_match:
-                        publisher = clean_text(published_match.group(1))
-                    else:
-                        produced_match = re.search(r'produced\s+by\s+([^\.\n]+)', desc_text, re.IGNORECASE)
-                        if produced_match:
-                            publisher = clean_text(produced_match.group(1))
+            if not publisher and desc_blob:
+                published_match = _PUBLISHED_BY_RE.search(desc_blob)
+                if published_match:
+                    publisher = clean_text(published_match.group(1))
+                else:
+                    produced_match = _PRODUCED_BY_RE.search(desc_blob)
+                    if produced_match:
+                        publisher = clean_text(produced_match.group(1))
             
             # Set publisher - ComicsAdda is a seller, not a publisher
             # Filter out invalid publisher values like "Brands", "Individual", etc.
-            invalid_publishers = ['brands', 'individual', 'comicsadda', 'comics adda', 'n/a', 'none', '']
-            if publisher and publisher.lower() not in invalid_publishers:
+            if publisher and publisher.lower() not in _INVALID_PUBLISHERS:
                 item['publisher'] = publisher
             else:
                 item['publisher'] = 'Unknown'
@@ -409,21 +495,9 @@ class ComicsAddaSpider(BaseComicSpider):
                 item['original_price'] = item['price']
             
             # Extract description
-            description_text = []
-            
-            # Strategy 1: Get description from product description section
-            desc_selectors = [
-                '.product-description::text',
-                '.description::text',
-                '#tab-description::text',
-                '.tab-content .description::text',
-            ]
-            for selector in desc_selectors:
-                desc_parts = response.css(selector).getall()
-                if desc_parts:
-                    description_text.extend([clean_text(d) for d in desc_parts if clean_text(d)])
-                    break
-            
+            # Strategy 1: reuse the description parts read at the top
+            description_text = [c for d in desc_parts if (c := clean_text(d))]
+
             # Strategy 2: Get all text from description tab
             if not description_text:
                 desc_tab = response.css('#tab-description, .tab-description, .product-description')
@@ -434,55 +508,40 @@ class ComicsAddaSpider(BaseComicSpider):
             
             if description_text:
                 item['description'] = ' '.join(description_text)
-            
+
+            # Title and description are final from here on; read them once
+            # (and lowercase them once) for the series/language/binding/page
+            # and release-date blocks below
+            title_text = item.get('title') or ''
+            desc_text = item.get('description') or ''
+            haystack = f'{title_text} {desc_text}'.lower()
+
             # Extract series information from title
-            if item.get('title'):
-                title = item['title']
-                
+            if title_text:
                 # Extract series name - stop at Issue, Vol./Volume, Stage, colon, dash, or hash
-                series_match = re.search(r'^(.+?)(?:\s+Issue\s+\d+|\s+Vol\.|\s+Vol\s+\d+|\s+Volume\s+\d+|\s+Volume\s+|\s+Stage\s+\d+|[:–\-#]|\(Pre Booking\)|\(Prebooking\))', title, re.IGNORECASE)
+                series_match = _SERIES_RE.search(title_text)
                 if not series_match:
                     # Fallback: if no Issue/Vol./Stage found, stop at colon, dash, or hash
-                    series_match = re.search(r'^([^:–\-#(]+)', title)
+                    series_match = _SERIES_FALLBACK_RE.search(title_text)
                 
                 if series_match:
                     series_name = clean_text(series_match.group(1))
                     
                     # Clean up series name by removing common suffixes
-                    series_name = re.sub(r'\s+English\s+', ' ', series_name, flags=re.IGNORECASE).strip()
-                    series_name = re.sub(r'\s+Hindi\s+', ' ', series_name, flags=re.IGNORECASE).strip()
-                    series_name = re.sub(r'\s+English\s*$', '', series_name, flags=re.IGNORECASE).strip()
-                    series_name = re.sub(r'\s+Hindi\s*$', '', series_name, flags=re.IGNORECASE).strip()
-                    series_name = re.sub(r'\s+Issue\s+\d+\s*$', '', series_name, flags=re.IGNORECASE).strip()
-                    series_name = re.sub(r'\s+Vol\.?\s+\d+\s*$', '', series_name, flags=re.IGNORECASE).strip()
-                    series_name = re.sub(r'\s+Volume\s+\d+\s*$', '', series_name, flags=re.IGNORECASE).strip()
-                    series_name = re.sub(r'\s+Stage\s+\d+\s*$', '', series_name, flags=re.IGNORECASE).strip()
-                    
-                    # Remove other suffixes
-                    invalid_suffixes = [
-                        r'\s+Issue\s*$',
-                        r'\s+Hardcover\s*$',
-                        r'\s+Paperback\s*$',
-                        r'\s+Variant\s*$',
-                        r'\s+Regular\s+Cover\s*$',
-                        r'\s+Pre\s+Booking\s*$',
-                        r'\s+Prebooking\s*$',
-                    ]
-                    
-                    for suffix_pattern in invalid_suffixes:
-                        series_name = re.sub(suffix_pattern, '', series_name, flags=re.IGNORECASE).strip()
+                    series_name = _MID_LANG_RE.sub(' ', series_name).strip()
+                    while True:
+                        cleaned = _SERIES_CLEAN_RE.sub('', series_name).strip()
+                        if cleaned == series_name:
+                            break
+                        series_name = cleaned
                     
                     # Check if the cleaned series name is valid
-                    invalid_series_values = [
-                        'Issue', 'issue', 'English', 'Hindi', 'Variant', 'Pre Booking', 'Prebooking'
-                    ]
-                    
-                    if series_name and series_name not in invalid_series_values:
+                    if series_name and series_name not in _INVALID_SERIES:
                         if len(series_name) > 2 and not series_name.isdigit():
                             item['series'] = series_name
                     
                     # Extract issue number
-                    issue_match = re.search(r'Issue[-\s]*(\d+)', title, re.IGNORECASE)
+                    issue_match = _ISSUE_RE.search(title_text)
                     if issue_match:
                         try:
                             item['issue'] = int(issue_match.group(1))
@@ -490,70 +549,30 @@ class ComicsAddaSpider(BaseComicSpider):
                             pass
                     else:
                         # Try to extract number from title (e.g., "Vol. 3")
-                        vol_match = re.search(r'Vol\.?\s*(\d+)', title, re.IGNORECASE)
+                        vol_match = _VOL_RE.search(title_text)
                         if vol_match:
                             try:
                                 item['issue'] = int(vol_match.group(1))
                             except ValueError:
                                 pass
             
-            # Extract language
-            language = None
-            title_lower = item.get('title', '').lower()
-            desc_lower = item.get('description', '').lower() if item.get('description') else ''
-            
-            if 'hindi' in title_lower or 'hindi' in desc_lower:
-                language = 'Hindi'
-            elif 'english' in title_lower or 'english' in desc_lower:
-                language = 'English'
-            elif 'malayalam' in title_lower or 'malayalam' in desc_lower:
-                language = 'Malayalam'
-            elif 'bangla' in title_lower or 'bengali' in title_lower:
-                language = 'Bengali'
-            
+            # Extract language and binding from the lowercased haystack
+            language = next((v for k, v in _LANG_KEYWORDS if k in haystack), None)
             if language:
                 item['language'] = language
-            
-            # Extract binding information
-            binding = None
-            title_lower = item.get('title', '').lower()
-            desc_lower = item.get('description', '').lower() if item.get('description') else ''
-            
-            # Check title and description for binding keywords
-            binding_patterns = [
-                (r'\b(hardbound|hard\s*bound|hb)\b', 'Hardbound'),
-                (r'\b(paperback|paper\s*back|pb)\b', 'Paperback'),
-                (r'\b(hardcover|hard\s*cover|hc)\b', 'Hardcover'),
-                (r'\b(softcover|soft\s*cover)\b', 'Softcover'),
-                (r'\b(deluxe\s*edition)\b', 'Deluxe Edition'),
-            ]
-            
-            for pattern, binding_value in binding_patterns:
-                if re.search(pattern, title_lower) or (desc_lower and re.search(pattern, desc_lower)):
-                    binding = binding_value
-                    break
-            
-            if binding:
-                item['binding'] = binding
+
+            binding_match = _BINDING_RE.search(haystack)
+            if binding_match:
+                item['binding'] = _BINDING_MAP[binding_match.lastgroup]
             
             # Extract pages from description and other sources
             pages = None
-            desc_text = item.get('description', '') if item.get('description') else ''
-            title_text = item.get('title', '')
-            
+
             # Strategy 1: Look for pages in description with various patterns
             if desc_text:
-                # Pattern 1: "Pages: 48", "Pages 48", "48 Pages", "Page: 48", "Page 48"
-                pages_patterns = [
-                    r'pages?[:\s]+(\d+)',  # "Pages: 48" or "Pages 48"
-                    r'(\d+)\s*pages?',  # "48 Pages" or "48 pages"
-                    r'page\s+count[:\s]+(\d+)',  # "Page Count: 48"
-                    r'no\s+of\s+pages?[:\s]+(\d+)',  # "No of Pages: 48"
-                    r'number\s+of\s+pages?[:\s]+(\d+)',  # "Number of Pages: 48"
-                ]
-                
-                for pattern in pages_patterns:
-                    pages_match = re.search(pattern, desc_text, re.IGNORECASE)
+                # "Pages: 48", "Pages 48", "48 Pages", "Page Count: 48", ...
+                for pattern in _PAGES_RES:
+                    pages_match = pattern.search(desc_text)
                     if pages_match:
                         try:
                             pages = int(pages_match.group(1))
@@ -565,29 +584,19 @@ class ComicsAddaSpider(BaseComicSpider):
             
             # Strategy 2: Look for pages in title
             if not pages and title_text:
-                pages_match = re.search(r'(\d+)\s*pages?', title_text, re.IGNORECASE)
+                pages_match = _PAGES_TITLE_RE.search(title_text)
                 if pages_match:
                     try:
                         pages = int(pages_match.group(1))
                     except ValueError:
                         pass
             
-            # Strategy 3: Extract from raw description HTML/text (before cleaning)
+            # Strategy 3: Extract from raw description text (before cleaning)
             if not pages:
-                # Get raw description from response
-                raw_desc_text = ' '.join(response.css('.product-description::text, .description::text, #tab-description::text').getall())
-                if raw_desc_text:
+                if desc_blob:
                     # Try same patterns on raw description
-                    pages_patterns = [
-                        r'pages?[:\s]+(\d+)',
-                        r'(\d+)\s*pages?',
-                        r'page\s+count[:\s]+(\d+)',
-                        r'no\s+of\s+pages?[:\s]+(\d+)',
-                        r'number\s+of\s+pages?[:\s]+(\d+)',
-                    ]
-                    
-                    for pattern in pages_patterns:
-                        pages_match = re.search(pattern, raw_desc_text, re.IGNORECASE)
+                    for pattern in _PAGES_RES:
+                        pages_match = pattern.search(desc_blob)
                         if pages_match:
                             try:
                                 pages = int(pages_match.group(1))
@@ -636,21 +645,21 @@ class ComicsAddaSpider(BaseComicSpider):
                 # If it's a cached thumbnail, try to get larger versions
                 if '/image/cache/catalog/' in url_lower:
                     # Try 700x700 first (common large size) - preserve original case
-                    larger_url = re.sub(r'-\d+x\d+\.(jpg|jpeg|png|webp)', r'-700x700.\1', url, flags=re.IGNORECASE)
+                    larger_url = _IMG_SIZE_RE.sub(r'-700x700.\1', url)
                     if larger_url != url:
                         return larger_url
-                    
+
                     # Try 800x800 - preserve original case
-                    larger_url = re.sub(r'-\d+x\d+\.(jpg|jpeg|png|webp)', r'-800x800.\1', url, flags=re.IGNORECASE)
+                    larger_url = _IMG_SIZE_RE.sub(r'-800x800.\1', url)
                     if larger_url != url:
                         return larger_url
-                
+
                 # Try to get original (remove cache and size suffix) - preserve case
                 if '/image/cache/catalog/' in url_lower:
                     # Remove /cache/ from path (case-insensitive)
-                    original_url = re.sub(r'/image/cache/catalog/', '/image/catalog/', url, flags=re.IGNORECASE)
+                    original_url = _IMG_CACHE_RE.sub('/image/catalog/', url)
                     # Remove size suffix like -300x300, -700x700, etc.
-                    original_url = re.sub(r'-\d+x\d+\.(jpg|jpeg|png|webp)', r'.\1', original_url, flags=re.IGNORECASE)
+                    original_url = _IMG_SIZE_RE.sub(r'.\1', original_url)
                     return original_url
                 
                 return None
@@ -837,8 +846,8 @@ class ComicsAddaSpider(BaseComicSpider):
             # Extract additional info from product attributes/description
             additional_info = {}
             
-            # Try to extract from product attributes table
-            attribute_rows = response.css('.attribute tr, .product-attributes tr')
+            # Try to extract from the product attributes table rows selected
+            # at the top
             for row in attribute_rows:
                 key = clean_text(' '.join(row.css('td:first-child::text, th:first-child::text').getall()))
                 value = clean_text(' '.join(row.css('td:last-child::text, th:last-child::text').getall()))
@@ -879,14 +888,8 @@ class ComicsAddaSpider(BaseComicSpider):
             # Extract release date if available
             release_date = None
             # Try to extract from description or additional info
-            date_patterns = [
-                r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})',  # DD-MM-YYYY or DD/MM/YYYY
-                r'(\d{4}[-/]\d{1,2}[-/]\d{1,2})',  # YYYY-MM-DD or YYYY/MM/DD
-            ]
-            
-            desc_text = item.get('description', '') if item.get('description') else ''
-            for pattern in date_patterns:
-                date_match = re.search(pattern, desc_text)
+            for pattern in _DATE_RES:
+                date_match = pattern.search(desc_text)
                 if date_match:
                     release_date = parse_date(date_match.group(1))
                     if release_date:
@@ -21,12 +21,19 @@ except ImportError:
             PYTZ_AVAILABLE = False
 
 
+# Compiled once at import; these run for every string field of every item
+_WS_RE = re.compile(r'\s+')
+_NUMBER_RE = re.compile(r'\d+\.?\d*')
+_LIST_SPLIT_RE = re.compile(r'[,;|]')
+_DOMAIN_RE = re.compile(r'https?://([^/]+)')
+
+
 def clean_text(text: Optional[str]) -> Optional[str]:
     """Clean and normalize text content"""
     if not text:
         return None
     # Remove extra whitespace and newlines
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = _WS_RE.sub(' ', text.strip())
     return text if text else None
 
 
@@ -65,7 +72,7 @@ def extract_numbers(text: Optional[str]) -> Optional[float]:
         return None
     
     # Remove currency symbols and extract number
-    numbers = re.findall(r'\d+\.?\d*', text.replace(',', ''))
+    numbers = _NUMBER_RE.findall(text.replace(',', ''))
     if numbers:
         try:
             return float(numbers[0])
@@ -80,7 +87,7 @@ def normalize_list(items: Optional[List]) -> List:
         return []
     if isinstance(items, str):
         # Split by common delimiters
-        items = re.split(r'[,;|]', items)
+        items = _LIST_SPLIT_RE.split(items)
     return [clean_text(str(item)) for item in items if item and clean_text(str(item))]
 
 
@@ -109,6 +116,6 @@ def extract_url_domain(url: str) -> Optional[str]:
     """Extract domain from URL"""
     if not url:
         return None
-    match = re.search(r'https?://([^/]+)', url)
+    match = _DOMAIN_RE.search(url)
     return match.group(1) if match else None
 
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+"""
+Pretty-print a scraped JSON dump for human inspection.
+
+The export pipeline writes compact JSON to keep the crawl's I/O small; run
+this when you actually want to read a dump:
+
+    python scripts/prettify_json.py data/2026-08-31/BullseyePress/<file>.json
+    python scripts/prettify_json.py <file>.json -o pretty.json
+"""
+import argparse
+import json
+import sys
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pretty-print a JSON dump")
+    parser.add_argument("path", help="JSON file to pretty-print")
+    parser.add_argument("-o", "--output", help="Write to this file instead of stdout")
+    args = parser.parse_args()
+
+    with open(args.path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        json.dump(data, out, ensure_ascii=False, indent=2)
+        out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()